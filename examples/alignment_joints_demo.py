@@ -387,7 +387,7 @@ post_top_extension = 40
 housing_depth = 20
 
 # Position beam for blind mortise cut - pass both beam and positioned post
-_, post_for_cut = position_for_blind_mortise(
+beam_for_cut, post_for_cut = position_for_blind_mortise(
     beam=beam_with_tenon,
     post=positioned_post,
     tenon_length=tenon_length,
@@ -398,7 +398,7 @@ _, post_for_cut = position_for_blind_mortise(
 
 # Create mortise in positioned post
 post_with_mortise = create_receiving_cut(
-    positioned_insert=beam_with_tenon,
+    positioned_insert=beam_for_cut,
     receiving_shape=post_for_cut,
 )
 
@@ -459,7 +459,7 @@ post_top_extension = 40
 housing_depth = 20
 
 # Position beam for blind mortise cut - pass both beam and positioned post
-_, post_for_cut = position_for_blind_mortise(
+beam_for_cut, post_for_cut = position_for_blind_mortise(
     beam=beam_with_tenon,
     post=positioned_post,
     tenon_length=tenon_length,
@@ -470,7 +470,7 @@ _, post_for_cut = position_for_blind_mortise(
 
 # Create mortise in positioned post
 post_with_mortise = create_receiving_cut(
-    positioned_insert=beam_with_tenon,
+    positioned_insert=beam_for_cut,
     receiving_shape=post_for_cut,
 )
 
@@ -14,6 +14,7 @@ from timber_joints.alignment import (
     align_beam_in_post,
     make_post_vertical,
     create_receiving_cut,
+    create_receiving_cuts,
     position_for_blind_mortise,
     build_complete_bent,
     calculate_brace_angle,
@@ -22,7 +23,7 @@ from timber_joints.alignment import (
     create_brace_for_girt,
     PositionedBrace,
 )
-from timber_joints.utils import get_shape_dimensions
+from timber_joints.utils import get_shape_bbox, get_shape_dimensions
 from timber_joints.config import (
     MORTISE_CLEARANCE,
     TimberJointConfig,
@@ -82,12 +83,14 @@ __all__ = [
     "HalfDovetail",
     "BraceTenon",
     # Utilities
+    "get_shape_bbox",
     "get_shape_dimensions",
     # Alignment
     "align_beam_on_post",
     "align_beam_in_post",
     "make_post_vertical",
     "create_receiving_cut",
+    "create_receiving_cuts",
     "position_for_blind_mortise",
     "build_complete_bent",
     "calculate_brace_angle",
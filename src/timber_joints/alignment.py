@@ -1,10 +1,24 @@
 """Alignment utilities for positioning timber joints."""
 
-import copy
 import math
+import weakref
+from functools import lru_cache
+from itertools import product
 from dataclasses import dataclass, field
 from typing import Optional, List, Type, TYPE_CHECKING
-from build123d import Location, Axis, Part, Plane
+import numpy as np
+from build123d import Align, Axis, BoundBox, Box, Compound, Location, Part, Plane
+from OCP.Bnd import Bnd_Box
+from OCP.BRepBndLib import BRepBndLib
+from OCP.gp import gp_Pnt, gp_Trsf, gp_Vec
+from OCP.TopLoc import TopLoc_Location
+from timber_joints.beam import Beam
+from timber_joints.brace_tenon import BraceTenon
+from timber_joints.config import DEFAULT_CONFIG
+from timber_joints.lap_joint import LapJoint
+from timber_joints.shouldered_tenon import ShoulderedTenon
+from timber_joints.tenon import Tenon
+from timber_joints.utils import create_peg, create_vertical_cut, expand_shape_by_margin
 
 if TYPE_CHECKING:
     from timber_joints.base_joint import BaseJoint
@@ -27,7 +41,6 @@ class JointParams:
     
     def get_joint_class(self):
         if self.joint_class is None:
-            from timber_joints.shouldered_tenon import ShoulderedTenon
             return ShoulderedTenon
         return self.joint_class
     
@@ -54,13 +67,11 @@ class BraceParams:
     
     def get_post_joint_class(self):
         if self.post_joint_class is None:
-            from timber_joints.brace_tenon import BraceTenon
             return BraceTenon
         return self.post_joint_class
     
     def get_beam_joint_class(self):
         if self.beam_joint_class is None:
-            from timber_joints.brace_tenon import BraceTenon
             return BraceTenon
         return self.beam_joint_class
 
@@ -131,7 +142,7 @@ class RafterResult:
     updated_right_girt: Part        # Right girt with all lap cuts
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PositionedBrace:
     """A brace with its positioning and cut receiving members.
     
@@ -147,6 +158,72 @@ class PositionedBrace:
     axis: Axis = Axis.X  # X for bent braces, Y for girt braces
 
 
+# Bounding boxes per shape as (xmin, ymin, zmin, xmax, ymax, zmax). Shapes hash
+# and compare by TShape + Location, so an in-place move() changes the key and
+# a stale box is never returned. Fresh wrappers around the same located
+# TopoDS_Shape (e.g. Part(shape.wrapped) or copy.copy) hit the same entry.
+_BBOX_CACHE: "weakref.WeakKeyDictionary[Part, tuple[float, ...]]" = weakref.WeakKeyDictionary()
+
+
+def _raw_bbox(shape: Part) -> tuple[float, float, float, float, float, float]:
+    """Optimal bounding box of a shape as six floats, memoized while it is unmoved.
+    
+    Same box as shape.bounding_box(), read straight off the Bnd_Box without
+    building Vector/BoundBox wrappers.
+    """
+    raw = _BBOX_CACHE.get(shape)
+    if raw is None:
+        box = Bnd_Box()
+        # Exact box from the BRep geometry; ignoring any triangulation gives the
+        # same result as bounding_box() without stripping the shape's mesh first
+        BRepBndLib.AddOptimal_s(shape.wrapped, box, False, False)
+        if box.IsVoid():
+            raw = (0.0,) * 6
+        else:
+            raw = (
+                box.GetXMin(), box.GetYMin(), box.GetZMin(),
+                box.GetXMax(), box.GetYMax(), box.GetZMax(),
+            )
+        _BBOX_CACHE[shape] = raw
+    return raw
+
+
+def _placed_beam_bounds(beam: Beam, location: Location) -> tuple[float, ...]:
+    """Raw bounds of a beam's solid relocated by location, without a BRep query.
+    
+    The beam is a box from (0, 0, 0) to (length, width, height), so its
+    placed bounds are exactly the min/max of its eight transformed corners.
+    """
+    trsf = location.wrapped.Transformation()
+    corners = [
+        gp_Pnt(x, y, z).Transformed(trsf)
+        for x, y, z in product((0.0, beam.length), (0.0, beam.width), (0.0, beam.height))
+    ]
+    xs = [p.X() for p in corners]
+    ys = [p.Y() for p in corners]
+    zs = [p.Z() for p in corners]
+    return (min(xs), min(ys), min(zs), max(xs), max(ys), max(zs))
+
+
+def _placed_beam(beam: Beam, location: Location) -> Part:
+    """A beam's solid relocated, with its bounds seeded without a BRep query."""
+    shape = beam.shape.moved(location)
+    _BBOX_CACHE[shape] = _placed_beam_bounds(beam, location)
+    return shape
+
+
+def _bound_box(raw: tuple[float, ...]) -> BoundBox:
+    """BoundBox from raw (xmin, ymin, zmin, xmax, ymax, zmax) bounds."""
+    box = Bnd_Box()
+    box.Update(*raw)
+    return BoundBox(box)
+
+
+def _bbox(shape: Part) -> BoundBox:
+    """BoundBox of a shape, built from the memoized raw bounds."""
+    return _bound_box(_raw_bbox(shape))
+
+
 def get_tenon_penetration(brace_tenon: "BraceTenon") -> float:
     """Get tenon penetration depth into the receiving member (perpendicular to surface)."""
     return brace_tenon.rotated_cut_bbox_width
@@ -172,19 +249,6 @@ def _calculate_brace_position_along_axis(
         return post_inside - rot_bbox_max + penetration
 
 
-def _get_axis_values(bbox, axis: Axis) -> tuple[float, float]:
-    """Get (min, max) values along the specified axis from a bounding box."""
-    if axis == Axis.X:
-        return bbox.min.X, bbox.max.X
-    else:
-        return bbox.min.Y, bbox.max.Y
-
-
-def _get_perpendicular_axis(axis: Axis) -> Axis:
-    """Get the perpendicular axis (X <-> Y)."""
-    return Axis.Y if axis == Axis.X else Axis.X
-
-
 def _calculate_brace_centering(
     post_center: float,
     rot_bbox_min: float,
@@ -195,6 +259,42 @@ def _calculate_brace_centering(
     return post_center - rot_bbox_center
 
 
+def _brace_position_from_bounds(
+    post_bounds: tuple[float, ...],
+    member_bounds: tuple[float, ...],
+    rot_bounds: tuple[float, ...],
+    horizontal_penetration: float,
+    vertical_penetration: float,
+    at_member_start: bool,
+    along_x: bool,
+) -> tuple[float, float, float]:
+    """Target min corner for a rotated brace, from raw bounds only.
+    
+    rot_bounds are the uncut brace's bounds after rotation; along_x selects
+    bent braces (along X) or girt braces (along Y).
+    """
+    # Index of the brace axis and of the axis across it in (x, y, z) bounds
+    along, perp = (0, 1) if along_x else (1, 0)
+    
+    # Target Z: brace top aligns with member bottom + penetration
+    target_top_z = member_bounds[2] + vertical_penetration
+    target_z = target_top_z - rot_bounds[5]
+    
+    # Position along the brace axis - same logic for X and Y, but the
+    # Y axis uses inverted logic
+    target_along = _calculate_brace_position_along_axis(
+        post_bounds[along], post_bounds[along + 3],
+        rot_bounds[along], rot_bounds[along + 3],
+        horizontal_penetration, at_member_start, not along_x
+    )
+    post_center_perp = (post_bounds[perp] + post_bounds[perp + 3]) / 2
+    target_perp = _calculate_brace_centering(post_center_perp, rot_bounds[perp], rot_bounds[perp + 3])
+    
+    if along_x:
+        return target_along, target_perp, target_z
+    return target_perp, target_along, target_z
+
+
 def _calculate_beam_position(
     beam: Part,
     post: Part,
@@ -202,27 +302,37 @@ def _calculate_beam_position(
     at_start: bool,
 ) -> tuple[float, float, float]:
     """Calculate where beam should be positioned relative to post at origin."""
-    beam_bbox = beam.bounding_box()
-    post_bbox = post.bounding_box()
+    return _beam_position_from_bounds(_raw_bbox(beam), _raw_bbox(post), drop_depth, at_start)
+
+
+def _beam_position_from_bounds(
+    beam_bounds: tuple[float, ...],
+    post_bounds: tuple[float, ...],
+    drop_depth: float,
+    at_start: bool,
+) -> tuple[float, float, float]:
+    """Beam target position from raw (min xyz, max xyz) bounds; pure float math."""
+    bx0, by0, _, bx1, by1, _ = beam_bounds
+    px0, py0, _, px1, py1, pz1 = post_bounds
     
     # Get actual dimensions from bounding boxes
-    beam_length = beam_bbox.max.X - beam_bbox.min.X
-    beam_width = beam_bbox.max.Y - beam_bbox.min.Y
-    post_width = post_bbox.max.Y - post_bbox.min.Y
+    beam_length = bx1 - bx0
+    beam_width = by1 - by0
+    post_width = py1 - py0
     
     if at_start:
         # Beam start at post - beam extends in +X direction from post's inner edge
-        target_x = post_bbox.min.X
+        target_x = px0
     else:
         # Beam end at post - beam's max.X should align with post's inner edge (max.X)
         # So beam's min.X = post's max.X - beam_length
-        target_x = post_bbox.max.X - beam_length
+        target_x = px1 - beam_length
     
     # Center beam on post width
-    target_y = post_bbox.min.Y + (post_width - beam_width) / 2
+    target_y = py0 + (post_width - beam_width) / 2
     
     # Beam drops into post by drop_depth from post top
-    target_z = post_bbox.max.Z - drop_depth
+    target_z = pz1 - drop_depth
     
     return target_x, target_y, target_z
 
@@ -237,60 +347,139 @@ def _calculate_post_position(
     
     The post is positioned so the beam end goes INTO the post (overlapping).
     """
-    beam_bbox = beam.bounding_box()
-    post_bbox = post.bounding_box()
+    return _post_position_from_bounds(_raw_bbox(beam), _raw_bbox(post), drop_depth, at_start)
+
+
+def _post_position_from_bounds(
+    beam_bounds: tuple[float, ...],
+    post_bounds: tuple[float, ...],
+    drop_depth: float,
+    at_start: bool,
+) -> tuple[float, float, float]:
+    """Post target position from raw (min xyz, max xyz) bounds; pure float math."""
+    bx0, by0, bz0, bx1, by1, _ = beam_bounds
+    px0, py0, pz0, px1, py1, pz1 = post_bounds
     
     # Get actual dimensions from bounding boxes
-    beam_width = beam_bbox.max.Y - beam_bbox.min.Y
-    post_x_extent = post_bbox.max.X - post_bbox.min.X  # Post's X dimension (depth/thickness)
-    post_width = post_bbox.max.Y - post_bbox.min.Y
-    post_z_extent = post_bbox.max.Z - post_bbox.min.Z  # Post's Z dimension (height when vertical)
+    beam_width = by1 - by0
+    post_x_extent = px1 - px0  # Post's X dimension (depth/thickness)
+    post_width = py1 - py0
+    post_z_extent = pz1 - pz0  # Post's Z dimension (height when vertical)
     
     if at_start:
         # Post at beam start - beam's min.X should be INSIDE the post
         # Post's min.X should be at beam's min.X (beam start enters post from post's min.X side)
-        target_x = beam_bbox.min.X
+        target_x = bx0
     else:
         # Post at beam end - beam's max.X should be INSIDE the post
         # Post's max.X should be at beam's max.X, so post's min.X = beam's max.X - post_x_extent
-        target_x = beam_bbox.max.X - post_x_extent
+        target_x = bx1 - post_x_extent
     
     # Center post on beam width
-    target_y = beam_bbox.min.Y + (beam_width - post_width) / 2
+    target_y = by0 + (beam_width - post_width) / 2
     
     # Post top (max.Z) should be at beam's min.Z + drop_depth
     # Post's min.Z = (beam.min.Z + drop_depth) - post_z_extent
-    target_z = beam_bbox.min.Z + drop_depth - post_z_extent
+    target_z = bz0 + drop_depth - post_z_extent
     
     return target_x, target_y, target_z
 
 
-def _move_shape_to_position(shape: Part, target_x: float, target_y: float, target_z: float) -> tuple[Part, Location]:
-    """Move a shape so its bounding box min aligns with target coordinates."""
-    bbox = shape.bounding_box()
-    location = Location((
-        target_x - bbox.min.X,
-        target_y - bbox.min.Y,
-        target_z - bbox.min.Z
-    ))
-    return shape.move(location), location
+def _translation(dx: float, dy: float, dz: float) -> Location:
+    """Build a pure translation Location straight from a gp_Trsf.
+    
+    Skips Location's argument dispatch, which shows up when positioning
+    many parts; the resulting transform is the same as Location((dx, dy, dz)).
+    """
+    trsf = gp_Trsf()
+    trsf.SetTranslation(gp_Vec(dx, dy, dz))
+    return Location(TopLoc_Location(trsf))
+
+
+def _rotation(axis: Axis, angle: float) -> Location:
+    """Rotation about an axis as a Location, the same transform Shape.rotate() applies."""
+    trsf = gp_Trsf()
+    trsf.SetRotation(axis.wrapped, math.radians(angle))
+    return Location(TopLoc_Location(trsf))
+
+
+def _half_turn_about_z(
+    x0: float, y0: float, z0: float, x1: float, y1: float, z1: float
+) -> Location:
+    """Half turn about the vertical axis through the centre of the given bounds.
+    
+    The matrix is written out directly so the mirrored coordinates are exact,
+    with no sin/cos round-off from a 180° rotation.
+    """
+    trsf = gp_Trsf()
+    trsf.SetValues(
+        -1, 0, 0, x0 + x1,
+        0, -1, 0, y0 + y1,
+        0, 0, 1, 0,
+    )
+    return Location(TopLoc_Location(trsf))
+
+
+def _translated(
+    shape: Part,
+    dx: float,
+    dy: float,
+    dz: float,
+    bounds: Optional[tuple[float, ...]] = None,
+) -> tuple[Part, Location]:
+    """Relocated copy of a shape translated by (dx, dy, dz), and the translation.
+    
+    If the shape's bounds are known (passed in or already cached), the copy's
+    bounds are seeded as the same box shifted by the offset.
+    """
+    location = _translation(dx, dy, dz)
+    moved = shape.moved(location)
+    bounds = bounds or _BBOX_CACHE.get(shape)
+    if bounds is not None:
+        x0, y0, z0, x1, y1, z1 = bounds
+        _BBOX_CACHE[moved] = (x0 + dx, y0 + dy, z0 + dz, x1 + dx, y1 + dy, z1 + dz)
+    return moved, location
+
+
+def _move_shape_to_position(
+    shape: Part,
+    target_x: float,
+    target_y: float,
+    target_z: float,
+    bounds: Optional[tuple[float, ...]] = None,
+) -> tuple[Part, Location]:
+    """Move a shape so its bounding box min aligns with target coordinates.
+    
+    Returns a relocated copy; the input shape is left where it was, and is
+    returned as is when it already sits at the target.
+    Pass the shape's raw bounds if the caller already has them.
+    """
+    bounds = bounds or _raw_bbox(shape)
+    x0, y0, z0 = bounds[:3]
+    if (x0, y0, z0) == (target_x, target_y, target_z):
+        return shape, Location()
+    return _translated(shape, target_x - x0, target_y - y0, target_z - z0, bounds=bounds)
 
 
 def align_beam_on_post(beam: Part, post: Part) -> tuple[Part, Location]:
-    """Align a beam horizontally on top of a vertical post, with beam start at post edge."""
-    beam_bbox = beam.bounding_box()
-    post_bbox = post.bounding_box()
+    """Align a beam horizontally on top of a vertical post, with beam start at post edge.
+    
+    Returns a relocated copy of the beam; the input is not moved in place.
+    """
+    beam_bounds = _raw_bbox(beam)
+    _, by0, _, _, by1, _ = beam_bounds
+    px0, py0, _, _, py1, pz1 = _raw_bbox(post)
     
     # Get actual dimensions from bounding boxes
-    beam_width = beam_bbox.max.Y - beam_bbox.min.Y
-    post_width = post_bbox.max.Y - post_bbox.min.Y
+    beam_width = by1 - by0
+    post_width = py1 - py0
     
     # Beam sits on top of post, starting at post edge
-    beam_x = post_bbox.min.X
-    beam_y = post_bbox.min.Y + (post_width - beam_width) / 2
-    beam_z = post_bbox.max.Z
+    beam_x = px0
+    beam_y = py0 + (post_width - beam_width) / 2
+    beam_z = pz1
     
-    return _move_shape_to_position(beam, beam_x, beam_y, beam_z)
+    return _move_shape_to_position(beam, beam_x, beam_y, beam_z, bounds=beam_bounds)
 
 
 def align_beam_in_post(
@@ -300,22 +489,39 @@ def align_beam_in_post(
     at_start: bool = True,
     move_post: bool = False,
 ) -> tuple[Part, Part, Location]:
-    """Align a beam dropped INTO a post (for tongue-and-fork style joints)."""
+    """Align a beam dropped INTO a post (for tongue-and-fork style joints).
+    
+    The moved shape (beam, or post with move_post) is a relocated copy; the
+    inputs are not moved in place, so use the returned shapes.
+    """
+    # Bounds are read once and shared by the position math and the move
+    beam_bounds = _raw_bbox(beam)
+    post_bounds = _raw_bbox(post)
     if move_post:
         # Keep beam at origin, move post to beam
-        target_x, target_y, target_z = _calculate_post_position(beam, post, drop_depth, at_start)
-        positioned_post, post_location = _move_shape_to_position(post, target_x, target_y, target_z)
+        target = _post_position_from_bounds(beam_bounds, post_bounds, drop_depth, at_start)
+        positioned_post, post_location = _move_shape_to_position(post, *target, bounds=post_bounds)
         return beam, positioned_post, post_location
     else:
         # Keep post at origin, move beam to post
-        target_x, target_y, target_z = _calculate_beam_position(beam, post, drop_depth, at_start)
-        positioned_beam, beam_location = _move_shape_to_position(beam, target_x, target_y, target_z)
+        target = _beam_position_from_bounds(beam_bounds, post_bounds, drop_depth, at_start)
+        positioned_beam, beam_location = _move_shape_to_position(beam, *target, bounds=beam_bounds)
         return positioned_beam, post, beam_location
 
 
+# -90° about Y through the origin: turns a post's length from X onto Z
+_POST_VERTICAL = Location((0, 0, 0), (0, 1, 0), -90)
+
+# 90° about Z through the origin: turns a length along X onto Y (girts, girt braces)
+_ALONG_Y = _rotation(Axis.Z, 90)
+
+
 def make_post_vertical(post_shape: Part) -> Part:
-    """Rotate a post to be vertical (length along Z axis instead of X)."""
-    return post_shape.rotate(Axis.Y, -90)
+    """Rotate a post to be vertical (length along Z axis instead of X).
+    
+    Only the shape's location changes; the geometry is shared, not copied.
+    """
+    return post_shape.moved(_POST_VERTICAL)
 
 
 def create_receiving_cut(
@@ -328,14 +534,30 @@ def create_receiving_cut(
     Positive margin makes the mortise larger than the tenon for clearance.
     If margin is None, uses the central config's cad_cut_margin.
     """
+    return receiving_shape - _with_cut_margin(positioned_insert, margin)
+
+
+def _with_cut_margin(positioned_insert: Part, margin: float = None) -> Part:
+    """Insert expanded by the cut margin (config default if None), ready to cut with."""
     if margin is None:
-        from timber_joints.config import DEFAULT_CONFIG
         margin = DEFAULT_CONFIG.cad_cut_margin
     if margin > 0:
-        from timber_joints.utils import expand_shape_by_margin
-        insert_with_margin = expand_shape_by_margin(positioned_insert, margin)
-        return receiving_shape - insert_with_margin
-    return receiving_shape - positioned_insert
+        return expand_shape_by_margin(positioned_insert, margin)
+    return positioned_insert
+
+
+def create_receiving_cuts(
+    positioned_inserts: list[Part],
+    receiving_shape: Part,
+    margin: float = None,
+) -> Part:
+    """Subtract several inserts from a receiving shape in one boolean operation.
+    
+    Each insert gets its own margin expansion (same as create_receiving_cut),
+    then all tools are cut together, so the receiving solid is only rebuilt once.
+    """
+    tools = [_with_cut_margin(s, margin) for s in positioned_inserts]
+    return receiving_shape - tools
 
 
 def position_for_blind_mortise(
@@ -346,12 +568,18 @@ def position_for_blind_mortise(
     post_top_extension: float = 0,
     at_start: bool = True,
     move_post: bool = False,
+    post_bounds: Optional[tuple[float, ...]] = None,
 ) -> tuple[Part, Part]:
-    """Offset beam or post to create a blind mortise (doesn't go through)."""
-    post_bbox = post.bounding_box()
+    """Offset beam or post to create a blind mortise (doesn't go through).
+    
+    The inputs are not mutated: the offset shape is returned as a relocated
+    copy, so always cut with the returned pair rather than the originals.
+    post_bounds may carry the post's raw bounds if the caller already has them.
+    """
+    px0, _, _, px1, _, _ = post_bounds or _raw_bbox(post)
     
     # Calculate post's X extent (thickness)
-    post_x_extent = post_bbox.max.X - post_bbox.min.X
+    post_x_extent = px1 - px0
     blind_offset = post_x_extent - housing_depth - tenon_length
     
     # Determine which direction to offset to create blind mortise
@@ -362,14 +590,18 @@ def position_for_blind_mortise(
         # Tenon at beam end - offset in +X direction (into post)
         x_offset = -blind_offset
     
+    # Through mortise flush with the post top: nothing to offset
+    if abs(x_offset) < 1e-9 and abs(post_top_extension) < 1e-9:
+        return beam, post
+    
     if move_post:
         # Move post instead of beam (reverse both offsets)
         # Post moves in opposite direction to achieve same relative cut position
-        post_for_cut = post.move(Location((-x_offset, 0, post_top_extension)))
+        post_for_cut, _ = _translated(post, -x_offset, 0, post_top_extension, bounds=post_bounds)
         return beam, post_for_cut
     else:
         # Move beam (default)
-        beam_for_cut = beam.move(Location((x_offset, 0, -post_top_extension)))
+        beam_for_cut, _ = _translated(beam, x_offset, 0, -post_top_extension)
         return beam_for_cut, post
 
 
@@ -380,45 +612,35 @@ def calculate_brace_angle(horizontal_distance: float, vertical_distance: float)
 
 def calculate_brace_length(horizontal_distance: float, vertical_distance: float) -> float:
     """Calculate required brace length (diagonal distance)."""
-    return math.sqrt(horizontal_distance**2 + vertical_distance**2)
+    return math.hypot(horizontal_distance, vertical_distance)
 
 
-def _create_brace(
-    post: Part,
-    horizontal_member: Part,
+@lru_cache(maxsize=16)
+def _brace_template(
     brace_section: float,
+    brace_length: float,
+    angle: float,
+    tenon_width: float,
+    tenon_length: float,
     at_member_start: bool,
-    axis: Axis,
-    tenon_width: float = None,
-    tenon_length: float = 60.0,
-    angle: float = 45.0,
-    brace_length: float = 707.0,
-) -> PositionedBrace:
-    """Create and position a brace between a post and horizontal member.
-    
-    Handles both bent braces (X axis) and girt braces (Y axis). The brace penetrates
-    into the horizontal member until the lower corner touches the member bottom surface.
-    """
-    from timber_joints.beam import Beam
-    from timber_joints.brace_tenon import BraceTenon
+    along_x: bool,
+) -> tuple[Part, tuple[float, ...], float, float]:
+    """Tenoned brace rotated into place at the origin.
     
-    post_bbox = post.bounding_box()
-    member_bbox = horizontal_member.bounding_box()
-    
-    # Set up tenon dimensions
-    if tenon_width is None:
-        tenon_width = brace_section / 3
+    Braces with the same parameters only differ by a translation, so the
+    tenon cuts are made once per configuration and shared.
     
+    Returns:
+        (brace, uncut rotated bounds, horizontal penetration, vertical penetration)
+    """
     # === UNIFIED APPROACH ===
     # Create brace with tenons: positions depend on which end connects to what
     # - at_member_start=True: post at start of brace, member at end
     # - at_member_start=False: member at start of brace, post at end
     
-    # Create brace WITHOUT cuts first (for positioning reference)
-    brace_no_cuts = Beam(length=brace_length, width=brace_section, height=brace_section).shape
-    
-    # Also create brace WITH cuts
-    brace_for_cuts = Beam(length=brace_length, width=brace_section, height=brace_section).shape
+    # One brace box: cut for the result, its uncut bounds used for positioning
+    brace_beam = Beam(length=brace_length, width=brace_section, height=brace_section)
+    brace_for_cuts = brace_beam.shape
     
     # Determine tenon positions based on brace orientation
     post_tenon_at_start = at_member_start
@@ -437,7 +659,9 @@ def _create_brace(
         tenon_length_adjusted_post = tenon_length / math.sin(math.radians(tenon_angle))
         tenon_length_adjusted_member = tenon_length / math.sin(math.radians(90 - tenon_angle))
 
-    # Cut post tenon
+    # Post and member tenons are both laid out on the uncut brace; their
+    # release cuts are positioned from the brace ends, so trimming one tip first
+    # does not move the other, and both tenons' waste is cut in one boolean
     brace_with_post_tenon = BraceTenon(
         brace=brace_for_cuts,
         tenon_width=tenon_width,
@@ -446,65 +670,88 @@ def _create_brace(
         at_start=post_tenon_at_start,
     )
     
-    # Cut member tenon
     brace_with_both_tenons = BraceTenon(
-        brace=brace_with_post_tenon.shape,
+        brace=brace_for_cuts,
         tenon_width=tenon_width,
         tenon_length=tenon_length_adjusted_member,
         brace_angle=tenon_angle,
         at_start=member_tenon_at_start,
     )
-    brace_with_cuts = brace_with_both_tenons.shape
+    brace_with_cuts = brace_for_cuts - [*brace_with_post_tenon.waste, *brace_with_both_tenons.waste]
     
     # Penetration depths use the same utility function for both directions
     horizontal_penetration = get_tenon_penetration(brace_with_post_tenon)
     vertical_penetration = get_tenon_penetration(brace_with_both_tenons)
     
     # Determine rotation axis for tilting (perpendicular to brace direction)
-    tilt_axis = Axis.Y if axis == Axis.X else Axis.X
-    
-    # For Y-axis braces, first rotate 90° around Z to align with Y axis
-    if axis == Axis.Y:
-        brace_no_cuts = brace_no_cuts.rotate(Axis.Z, 90)
-        brace_with_cuts = brace_with_cuts.rotate(Axis.Z, 90)
+    tilt_axis = Axis.Y if along_x else Axis.X
     
     # Angle sign: +angle tilts up-right (for at_member_start=False)
     #            -angle tilts up-left (for at_member_start=True)
     angle_sign = -1 if at_member_start else 1
-    rotated_brace_no_cuts = brace_no_cuts.rotate(tilt_axis, angle_sign * angle)
-    rotated_brace_with_cuts = brace_with_cuts.rotate(tilt_axis, angle_sign * angle)
+    brace_orientation = _rotation(tilt_axis, angle_sign * angle)
+    # For Y-axis braces, first rotate 90° around Z to align with Y axis
+    if not along_x:
+        brace_orientation = brace_orientation * _ALONG_Y
+    rotated_brace_with_cuts = brace_with_cuts.moved(brace_orientation)
     
-    # Use brace WITHOUT cuts for positioning (consistent bbox)
-    rot_bbox = rotated_brace_no_cuts.bounding_box()
+    # Use brace WITHOUT cuts for positioning (consistent bbox, from its rotated corners)
+    rot_bounds = _placed_beam_bounds(brace_beam, brace_orientation)
+    return rotated_brace_with_cuts, rot_bounds, horizontal_penetration, vertical_penetration
 
-    # Target Z: brace top aligns with member bottom + penetration
-    target_top_z = member_bbox.min.Z + vertical_penetration
-    target_z = target_top_z - rot_bbox.max.Z
-    
-    # Position along the brace axis - same logic for X and Y
-    # Get coordinates along the brace axis and perpendicular to it
-    perp_axis = _get_perpendicular_axis(axis)
-    post_bbox_along = _get_axis_values(post_bbox, axis)
-    rot_bbox_along = _get_axis_values(rot_bbox, axis)
-    post_center_perp = (post_bbox.min.Y + post_bbox.max.Y) / 2 if axis == Axis.X else (post_bbox.min.X + post_bbox.max.X) / 2
-    rot_bbox_perp = _get_axis_values(rot_bbox, perp_axis)
+
+def _position_brace(
+    post: Part,
+    horizontal_member: Part,
+    brace_section: float,
+    at_member_start: bool,
+    axis: Axis,
+    tenon_width: float = None,
+    tenon_length: float = 60.0,
+    angle: float = 45.0,
+    brace_length: float = 707.0,
+) -> Part:
+    """Tenoned brace placed between a post and horizontal member, nothing cut yet.
     
-    # Y-axis uses inverted logic
-    invert = axis == Axis.Y
+    Handles both bent braces (X axis) and girt braces (Y axis). The brace penetrates
+    into the horizontal member until the lower corner touches the member bottom surface.
+    """
+    # Set up tenon dimensions
+    if tenon_width is None:
+        tenon_width = brace_section / 3
     
-    target_along = _calculate_brace_position_along_axis(
-        post_bbox_along[0], post_bbox_along[1],
-        rot_bbox_along[0], rot_bbox_along[1],
-        horizontal_penetration, at_member_start, invert
+    rotated_brace_with_cuts, rot_bounds, horizontal_penetration, vertical_penetration = _brace_template(
+        brace_section, brace_length, angle, tenon_width, tenon_length, at_member_start, axis == Axis.X
+    )
+    target_x, target_y, target_z = _brace_position_from_bounds(
+        _raw_bbox(post), _raw_bbox(horizontal_member), rot_bounds,
+        horizontal_penetration, vertical_penetration, at_member_start, axis == Axis.X
     )
-    target_perp = _calculate_brace_centering(post_center_perp, rot_bbox_perp[0], rot_bbox_perp[1])
     
-    # Assign to X/Y based on axis
-    target_x = target_along if axis == Axis.X else target_perp
-    target_y = target_perp if axis == Axis.X else target_along
+    # Position a copy of the shared brace using the calculated targets
+    positioned_brace, _ = _translated(rotated_brace_with_cuts, target_x, target_y, target_z)
+    return positioned_brace
+
+
+def _create_brace(
+    post: Part,
+    horizontal_member: Part,
+    brace_section: float,
+    at_member_start: bool,
+    axis: Axis,
+    tenon_width: float = None,
+    tenon_length: float = 60.0,
+    angle: float = 45.0,
+    brace_length: float = 707.0,
+) -> PositionedBrace:
+    """Create and position a brace between a post and horizontal member.
     
-    # Position the cut brace using the calculated targets
-    positioned_brace = rotated_brace_with_cuts.move(Location((target_x, target_y, target_z)))
+    Places the brace with _position_brace and cuts its mortises in both members.
+    """
+    positioned_brace = _position_brace(
+        post, horizontal_member, brace_section, at_member_start, axis,
+        tenon_width=tenon_width, tenon_length=tenon_length, angle=angle, brace_length=brace_length,
+    )
     
     # Cut mortises in receiving members
     post_with_mortise = create_receiving_cut(positioned_brace, post)
@@ -605,8 +852,6 @@ def create_tenon_peg_for_mortise(
     Returns:
         Cylindrical peg positioned to pass through tenon
     """
-    from timber_joints.utils import create_peg
-    
     # Peg length is full post width (Y direction)
     peg_length = post_bbox.max.Y - post_bbox.min.Y
     
@@ -658,9 +903,6 @@ def create_lap_peg_for_rafter(
     Returns:
         Cylindrical peg positioned to pass through lap joint
     """
-    import math
-    from timber_joints.utils import create_peg
-    
     # Peg length goes through lap depth plus into girt (total = lap_depth + some girt penetration)
     # Use lap_depth * 2 to go through rafter lap and into girt
     peg_length = lap_depth * 2
@@ -733,9 +975,6 @@ def create_peak_peg_for_rafter(
     Returns:
         Cylindrical peg positioned at the peak joint
     """
-    import math
-    from timber_joints.utils import create_peg
-    
     # Peg goes through Y direction
     peg_length = max(
         right_rafter_bbox.max.Y - right_rafter_bbox.min.Y,
@@ -801,9 +1040,6 @@ def create_brace_peg(
     Returns:
         Cylindrical peg positioned to pass through brace tenon
     """
-    import math
-    from timber_joints.utils import create_peg
-    
     # Peg goes through Y direction (side of receiving member)
     peg_length = receiving_member_bbox.max.Y - receiving_member_bbox.min.Y
     peg = create_peg(length=peg_length, diameter=peg_diameter, axis=Axis.Y)
@@ -859,6 +1095,95 @@ def create_brace_peg(
     return peg
 
 
+def _bent_alignment_offsets(
+    bboxes: np.ndarray,
+    drop_depth: float,
+    tenon_length: float,
+    housing_depth: float,
+    post_top_extension: float,
+) -> np.ndarray:
+    """Translations that assemble a bent, from the parts' initial bounds.
+    
+    Same placement as align_beam_in_post + position_for_blind_mortise applied
+    in sequence, but evaluated on a (3, 6) array of (min xyz, max xyz) rows for
+    the beam, left post and right post.
+    
+    Returns:
+        (2, 3) array of net translations for the beam (onto the left post,
+        then offset for its blind mortise) and for the right post (to the
+        beam end, then offset for its blind mortise).
+    """
+    lo, hi = bboxes[:, :3], bboxes[:, 3:]
+    size = hi - lo
+    # Blind mortise depth along X for both posts
+    blind = size[1:, 0] - housing_depth - tenon_length
+    # Y shift that centres the beam on each post's width
+    y_center = (size[1:, 1] - size[0, 1]) / 2
+    
+    offsets = np.empty((4, 3))
+    # Beam start at left post, centered on its width, dropped from its top
+    offsets[0] = np.array([
+        lo[1, 0],
+        lo[1, 1] + y_center[0],
+        hi[1, 2] - drop_depth,
+    ]) - lo[0]
+    offsets[1] = (blind[0], 0.0, -post_top_extension)
+    
+    # Right post around the beam end, using the beam where it ended up
+    beam_lo = lo[0] + offsets[0] + offsets[1]
+    beam_hi = hi[0] + offsets[0] + offsets[1]
+    offsets[2] = np.array([
+        beam_hi[0] - size[2, 0],
+        beam_lo[1] - y_center[1],
+        beam_lo[2] + drop_depth - size[2, 2],
+    ]) - lo[2]
+    offsets[3] = (blind[1], 0.0, post_top_extension)
+    return offsets[[0, 2]] + offsets[[1, 3]]
+
+
+@lru_cache(maxsize=16)
+def _tenoned_beam_template(
+    joint_class: type,
+    length: float,
+    width: float,
+    height: float,
+    tenon_width: float,
+    tenon_height: float,
+    tenon_length: float,
+    shoulder_depth: float,
+) -> tuple[Part, bool]:
+    """Bent beam with tenons on both ends, at the origin.
+    
+    Bents with the same dimensions share the tenon cuts; callers place
+    relocated copies and never move the template itself.
+    
+    Returns:
+        (tenoned beam, whether both tenons are the same waste turned end for end)
+    """
+    beam = Beam(length=length, width=width, height=height)
+    tenon_kwargs = dict(
+        tenon_width=tenon_width,
+        tenon_height=tenon_height,
+        tenon_length=tenon_length,
+        shoulder_depth=shoulder_depth,
+    )
+    # Only ShoulderedTenon is known to be centred in the section, so only its
+    # start waste can be taken as the end waste turned end for end. Any other
+    # class, subclasses included, gets both tenons cut separately
+    if joint_class is not ShoulderedTenon:
+        beam_with_start = joint_class(beam=beam, at_start=True, **tenon_kwargs).shape
+        return joint_class(beam=beam_with_start, at_start=False, **tenon_kwargs).shape, False
+    
+    # Both tenons are identical, so the start waste is the end waste turned
+    # half a turn about the beam's vertical centre line; cut both in one boolean
+    end_waste = joint_class(beam=beam, at_start=False, **tenon_kwargs).waste
+    start_waste = end_waste.moved(_half_turn_about_z(0.0, 0.0, 0.0, length, width, height))
+    beam_with_both_tenons = beam.shape - [start_waste, end_waste]
+    # The tenons reach both ends and the body keeps the full section
+    _BBOX_CACHE[beam_with_both_tenons] = beam.bounds
+    return beam_with_both_tenons, True
+
+
 def  build_complete_bent(
     post_height: float = 3000,
     post_section: float = 150,
@@ -868,8 +1193,6 @@ def  build_complete_bent(
     brace_params: BraceParams = None,
 ) -> BentResult:
     """Build a bent (two posts + beam) with optional braces."""
-    from timber_joints.beam import Beam
-    
     if joint_params is None:
         joint_params = JointParams()
     
@@ -888,68 +1211,47 @@ def  build_complete_bent(
     drop_depth = beam.height
     
     # Create beam with tenons on BOTH ends using the configured joint class
-    beam_with_start = JointClass(
-        beam=beam,
-        tenon_width=tenon_width,
-        tenon_height=tenon_height,
-        tenon_length=joint_params.tenon_length,
-        shoulder_depth=joint_params.shoulder_depth,
-        at_start=True,
-    ).shape
-
-    beam_with_both_tenons = JointClass(
-        beam=beam_with_start,
-        tenon_width=tenon_width,
-        tenon_height=tenon_height,
-        tenon_length=joint_params.tenon_length,
-        shoulder_depth=joint_params.shoulder_depth,
-        at_start=False,
-    ).shape
+    beam_with_both_tenons, symmetric_tenons = _tenoned_beam_template(
+        JointClass, beam.length, beam.width, beam.height,
+        tenon_width, tenon_height, joint_params.tenon_length, joint_params.shoulder_depth,
+    )
     
     # Make posts vertical
-    vertical_post_left = make_post_vertical(post_left.shape)
-    vertical_post_right = make_post_vertical(post_right.shape)
-    
-    # Step 1: Align beam to LEFT post (beam start at post)
-    positioned_beam, _, _ = align_beam_in_post(
-        beam=beam_with_both_tenons,
-        post=vertical_post_left,
+    vertical_post_left = _placed_beam(post_left, _POST_VERTICAL)
+    vertical_post_right = _placed_beam(post_right, _POST_VERTICAL)
+    
+    # Every placement step follows from the initial bounds, so compute the net
+    # moves in one batch: rows are (beam, left post, right post)
+    beam_move, right_post_move = _bent_alignment_offsets(
+        np.array([
+            _raw_bbox(beam_with_both_tenons),
+            _raw_bbox(vertical_post_left),
+            _raw_bbox(vertical_post_right),
+        ]),
         drop_depth=drop_depth,
-        at_start=True,
-        move_post=False,
-    )
-    
-    # Step 2: Create mortise in left post
-    beam_for_left_cut, _ = position_for_blind_mortise(
-        beam=positioned_beam,
-        post=vertical_post_left,
         tenon_length=joint_params.tenon_length,
         housing_depth=joint_params.housing_depth,
         post_top_extension=joint_params.post_top_extension,
-        at_start=True,
-    )
-    left_post_with_mortise = create_receiving_cut(beam_for_left_cut, vertical_post_left)
-    
-    # Step 3: Align right post to beam end (move post to beam)
-    _, positioned_post_right, _ = align_beam_in_post(
-        beam=positioned_beam,
-        post=vertical_post_right,
-        drop_depth=drop_depth,
-        at_start=False,
-        move_post=True,
-    )
-    
-    # Step 4: Create mortise in right post
-    _, positioned_post_right_cut = position_for_blind_mortise(
-        beam=positioned_beam,
-        post=positioned_post_right,
-        tenon_length=joint_params.tenon_length,
-        housing_depth=joint_params.housing_depth,
-        post_top_extension=joint_params.post_top_extension,
-        at_start=False,
-        move_post=True,
-    )
-    right_post_with_mortise = create_receiving_cut(positioned_beam, positioned_post_right_cut)
+    ).tolist()
+    
+    # Beam into the left post at its blind-mortise depth; right post around
+    # the beam end at its own blind-mortise depth
+    positioned_beam = beam_with_both_tenons.moved(_translation(*beam_move))
+    positioned_post_right_cut = vertical_post_right.move(_translation(*right_post_move))
+    
+    # With identical tenons the whole bent is symmetric about the beam's
+    # vertical centre line: right-side parts are the left ones turned around it
+    # instead of being cut separately
+    mirror = None
+    if symmetric_tenons:
+        beam_x, beam_y, _ = beam_move
+        mirror = _half_turn_about_z(beam_x, beam_y, 0.0, beam_x + beam_length, beam_y + beam.width, 0.0)
+    
+    left_post_with_mortise = create_receiving_cut(positioned_beam, vertical_post_left)
+    if mirror is not None:
+        right_post_with_mortise = left_post_with_mortise.moved(mirror)
+    else:
+        right_post_with_mortise = create_receiving_cut(positioned_beam, positioned_post_right_cut)
     
     left_post = left_post_with_mortise
     right_post = right_post_with_mortise
@@ -958,10 +1260,13 @@ def  build_complete_bent(
     # Create pegs for beam-to-post joints if requested
     pegs = []
     if joint_params.include_pegs:
+        # Both pegs are placed against the same positioned beam
+        placed_beam_bbox = _bbox(positioned_beam)
+        
         # Left post peg (beam start)
         left_peg = create_tenon_peg_for_mortise(
-            beam_bbox=beam_for_left_cut.bounding_box(),
-            post_bbox=vertical_post_left.bounding_box(),
+            beam_bbox=placed_beam_bbox,
+            post_bbox=_bbox(vertical_post_left),
             tenon_width=tenon_width,
             tenon_height=tenon_height,
             tenon_length=joint_params.tenon_length,
@@ -976,8 +1281,8 @@ def  build_complete_bent(
         
         # Right post peg (beam end)
         right_peg = create_tenon_peg_for_mortise(
-            beam_bbox=positioned_beam.bounding_box(),
-            post_bbox=positioned_post_right_cut.bounding_box(),
+            beam_bbox=placed_beam_bbox,
+            post_bbox=_bbox(positioned_post_right_cut),
             tenon_width=tenon_width,
             tenon_height=tenon_height,
             tenon_length=joint_params.tenon_length,
@@ -987,7 +1292,7 @@ def  build_complete_bent(
         )
         pegs.append(right_peg)
         # Cut peg hole from right post and beam
-        right_post = right_post - right_peg
+        right_post = left_post.moved(mirror) if mirror is not None else right_post - right_peg
         beam = beam - right_peg
     
     # Add braces if requested
@@ -1006,24 +1311,29 @@ def  build_complete_bent(
         left_post = left_brace_result.post
         beam = left_brace_result.horizontal_member
         
-        right_brace_result = create_brace_for_bent(
-            post=right_post, beam=beam,
-            brace_section=brace_params.section,
-            brace_length=brace_params.length,
-            angle=brace_params.angle,
-            tenon_length=brace_params.tenon_length,
-            at_beam_start=False,
-        )
-        brace_right = right_brace_result.shape
-        right_post = right_brace_result.post
-        beam = right_brace_result.horizontal_member
+        if mirror is not None:
+            brace_right = brace_left.moved(mirror)
+            right_post = left_post.moved(mirror)
+            beam = create_receiving_cut(brace_right, beam)
+        else:
+            right_brace_result = create_brace_for_bent(
+                post=right_post, beam=beam,
+                brace_section=brace_params.section,
+                brace_length=brace_params.length,
+                angle=brace_params.angle,
+                tenon_length=brace_params.tenon_length,
+                at_beam_start=False,
+            )
+            brace_right = right_brace_result.shape
+            right_post = right_brace_result.post
+            beam = right_brace_result.horizontal_member
         
         # Create brace pegs if requested
         if brace_params.include_pegs:
             # Left brace pegs (2 pegs: post connection and beam connection)
-            left_brace_bbox = brace_left.bounding_box()
-            left_post_bbox = left_post.bounding_box()
-            beam_bbox = beam.bounding_box()
+            left_brace_bbox = _bbox(brace_left)
+            left_post_bbox = _bbox(left_post)
+            beam_bbox = _bbox(beam)
             
             # Peg for left brace to post connection
             left_brace_post_peg = create_brace_peg(
@@ -1058,8 +1368,8 @@ def  build_complete_bent(
             brace_left = brace_left - left_brace_beam_peg
             
             # Right brace pegs (2 pegs: post connection and beam connection)
-            right_brace_bbox = brace_right.bounding_box()
-            right_post_bbox = right_post.bounding_box()
+            right_brace_bbox = _bbox(brace_right)
+            right_post_bbox = _bbox(right_post)
             
             # Peg for right brace to post connection
             right_brace_post_peg = create_brace_peg(
@@ -1074,8 +1384,11 @@ def  build_complete_bent(
             )
             pegs.append(right_brace_post_peg)
             # Cut peg hole from right post and right brace
-            right_post = right_post - right_brace_post_peg
-            brace_right = brace_right - right_brace_post_peg
+            if mirror is not None:
+                right_post = left_post.moved(mirror)
+            else:
+                right_post = right_post - right_brace_post_peg
+                brace_right = brace_right - right_brace_post_peg
             
             # Peg for right brace to beam connection
             right_brace_beam_peg = create_brace_peg(
@@ -1091,7 +1404,10 @@ def  build_complete_bent(
             pegs.append(right_brace_beam_peg)
             # Cut peg hole from beam and right brace
             beam = beam - right_brace_beam_peg
-            brace_right = brace_right - right_brace_beam_peg
+            if mirror is not None:
+                brace_right = brace_left.moved(mirror)
+            else:
+                brace_right = brace_right - right_brace_beam_peg
     
     return BentResult(
         left_post=left_post,
@@ -1114,10 +1430,6 @@ def add_girts_to_bents(
     brace_params: BraceParams = None,
 ) -> GirtResult:
     """Connect bents with longitudinal girts and optional braces."""
-    from timber_joints.beam import Beam
-    from timber_joints.tenon import Tenon
-    from timber_joints.utils import create_vertical_cut
-    
     if len(bents) != len(y_positions):
         raise ValueError("Number of bents must match number of y_positions")
     
@@ -1163,41 +1475,42 @@ def add_girts_to_bents(
     girt_length = (y_max - y_min) + first_bent.post_section
     
     # Get post positions from first bent (moved to y=0 reference)
-    left_bbox = first_bent.left_post.bounding_box()
-    right_bbox = first_bent.right_post.bounding_box()
-    left_post_x = (left_bbox.min.X + left_bbox.max.X) / 2
-    right_post_x = (right_bbox.min.X + right_bbox.max.X) / 2
+    lx0, _, _, lx1, _, lz1 = _raw_bbox(first_bent.left_post)
+    rx0, _, _, rx1, _, _ = _raw_bbox(first_bent.right_post)
+    left_post_x = (lx0 + lx1) / 2
+    right_post_x = (rx0 + rx1) / 2
     
     # Z position for girts (at top of posts, accounting for tenon/housing)
-    girt_z = left_bbox.max.Z - joint_params.tenon_length - joint_params.housing_depth
+    girt_z = lz1 - joint_params.tenon_length - joint_params.housing_depth
     
     # Create and position left girt
     left_girt_beam = Beam(length=girt_length, width=girt_section, height=girt_section)
-    left_girt = left_girt_beam.shape.rotate(Axis.Z, 90)
-    left_girt_bbox = left_girt.bounding_box()
+    left_girt = _placed_beam(left_girt_beam, _ALONG_Y)
+    gx0, gy0, gz0, gx1, _, _ = _raw_bbox(left_girt)
     left_girt = left_girt.move(Location((
-        left_post_x - (left_girt_bbox.min.X + left_girt_bbox.max.X) / 2,
-        y_min - left_girt_bbox.min.Y,
-        girt_z - left_girt_bbox.min.Z,
+        left_post_x - (gx0 + gx1) / 2,
+        y_min - gy0,
+        girt_z - gz0,
     )))
     
     # Create and position right girt
     right_girt_beam = Beam(length=girt_length, width=girt_section, height=girt_section)
-    right_girt = right_girt_beam.shape.rotate(Axis.Z, 90)
-    right_girt_bbox = right_girt.bounding_box()
+    right_girt = _placed_beam(right_girt_beam, _ALONG_Y)
+    gx0, gy0, gz0, gx1, _, _ = _raw_bbox(right_girt)
     right_girt = right_girt.move(Location((
-        right_post_x - (right_girt_bbox.min.X + right_girt_bbox.max.X) / 2,
-        y_min - right_girt_bbox.min.Y,
-        girt_z - right_girt_bbox.min.Z,
+        right_post_x - (gx0 + gx1) / 2,
+        y_min - gy0,
+        girt_z - gz0,
     )))
     
-    # Cut mortises in girts for each bent's posts
-    for bent, y_pos in zip(bents, y_positions):
-        # Move bent posts to their Y position for the cut (deepcopy to avoid mutating original)
-        left_post_at_y = copy.deepcopy(bent.left_post).move(Location((0, y_pos, 0)))
-        right_post_at_y = copy.deepcopy(bent.right_post).move(Location((0, y_pos, 0)))
-        left_girt = create_receiving_cut(left_post_at_y, left_girt)
-        right_girt = create_receiving_cut(right_post_at_y, right_girt)
+    # Cut mortises in girts for all bents' posts, one boolean per girt
+    # Relocated copies of the bent posts at their Y positions; the geometry is
+    # shared, so the originals are neither copied nor mutated
+    y_locations = [_translation(0, y_pos, 0) for y_pos in y_positions]
+    left_posts_at_y = [bent.left_post.moved(loc) for bent, loc in zip(bents, y_locations)]
+    right_posts_at_y = [bent.right_post.moved(loc) for bent, loc in zip(bents, y_locations)]
+    left_girt = create_receiving_cuts(left_posts_at_y, left_girt)
+    right_girt = create_receiving_cuts(right_posts_at_y, right_girt)
     
     # Add braces if requested
     braces = []
@@ -1205,10 +1518,17 @@ def add_girts_to_bents(
         num_bents = len(bents)
         final_bents = []
         
+        # Mortises are cut from below and inside the members' bounds, so every
+        # brace can be placed against the uncut girts and posts; the cuts are
+        # then made once per member instead of once per brace
+        left_girt_braces = []
+        right_girt_braces = []
         for i, (bent, y_pos) in enumerate(zip(bents, y_positions)):
-            # Move posts to Y position for brace creation (deepcopy to avoid mutating original)
-            left_post_at_y = copy.deepcopy(bent.left_post).move(Location((0, y_pos, 0)))
-            right_post_at_y = copy.deepcopy(bent.right_post).move(Location((0, y_pos, 0)))
+            # Posts at Y position for brace creation
+            left_post_at_y = left_posts_at_y[i]
+            right_post_at_y = right_posts_at_y[i]
+            left_post_braces = []
+            right_post_braces = []
             
             # Determine brace directions based on position
             # First bent: braces toward +Y only
@@ -1224,31 +1544,26 @@ def add_girts_to_bents(
             for toward_plus_y, suffix in directions:
                 at_girt_start = not toward_plus_y
                 
-                # Left side brace
-                left_brace_result = create_brace_for_girt(
-                    post=left_post_at_y, girt=left_girt,
-                    brace_section=brace_params.section,
-                    brace_length=brace_params.length,
-                    angle=brace_params.angle,
-                    tenon_length=brace_params.tenon_length,
-                    at_girt_start=at_girt_start,
-                )
-                braces.append((f"girt_brace_left_{i+1}{suffix}", left_brace_result.shape))
-                left_girt = left_brace_result.horizontal_member
-                left_post_at_y = left_brace_result.post  # Accumulate cuts on post
-                
-                # Right side brace
-                right_brace_result = create_brace_for_girt(
-                    post=right_post_at_y, girt=right_girt,
-                    brace_section=brace_params.section,
-                    brace_length=brace_params.length,
-                    angle=brace_params.angle,
-                    tenon_length=brace_params.tenon_length,
-                    at_girt_start=at_girt_start,
-                )
-                braces.append((f"girt_brace_right_{i+1}{suffix}", right_brace_result.shape))
-                right_girt = right_brace_result.horizontal_member
-                right_post_at_y = right_brace_result.post  # Accumulate cuts on post
+                # Left and right side braces
+                for post_at_y, girt, side, post_braces, girt_braces in (
+                    (left_post_at_y, left_girt, "left", left_post_braces, left_girt_braces),
+                    (right_post_at_y, right_girt, "right", right_post_braces, right_girt_braces),
+                ):
+                    brace = _position_brace(
+                        post_at_y, girt,
+                        brace_section=brace_params.section,
+                        at_member_start=at_girt_start,
+                        axis=Axis.Y,
+                        tenon_length=brace_params.tenon_length,
+                        angle=brace_params.angle,
+                        brace_length=brace_params.length,
+                    )
+                    braces.append((f"girt_brace_{side}_{i+1}{suffix}", brace))
+                    post_braces.append(brace)
+                    girt_braces.append(brace)
+            
+            left_post_at_y = create_receiving_cuts(left_post_braces, left_post_at_y)
+            right_post_at_y = create_receiving_cuts(right_post_braces, right_post_at_y)
             
             # Move posts back to Y=0 and update the bent with cut posts
             left_post_final = left_post_at_y.move(Location((0, -y_pos, 0)))
@@ -1266,6 +1581,8 @@ def add_girts_to_bents(
         
         # Use bents with girt brace mortises cut
         bents = final_bents
+        left_girt = create_receiving_cuts(left_girt_braces, left_girt)
+        right_girt = create_receiving_cuts(right_girt_braces, right_girt)
     
     return GirtResult(
         left_girt=left_girt,
@@ -1274,11 +1591,6 @@ def add_girts_to_bents(
         braces=braces,
     )
 
-from timber_joints.beam import Beam
-from timber_joints.shouldered_tenon import ShoulderedTenon
-from timber_joints.lap_joint import LapJoint
-from build123d import Part, Box, Vector, Location, Axis, Align, Compound
-from ocp_vscode import show_object
 
 def build_rafter_pair(
     left_girt: Part,
@@ -1286,17 +1598,18 @@ def build_rafter_pair(
     y_position: float,
     rafter_params: RafterParams,
 ) -> RafterPair:
-    from timber_joints.utils import create_peg
-    
+    # Girt bounds are read once as plain floats
+    lgx0, _, _, lgx1, _, lgz1 = _raw_bbox(left_girt)
+    _, _, _, rgx1, _, _ = _raw_bbox(right_girt)
     # Full building width (outer edge to outer edge of girts)
-    building_width = right_girt.bounding_box().max.X - left_girt.bounding_box().min.X
+    building_width = rgx1 - lgx0
     half_building_width = building_width / 2
     # Center X position between girts
-    building_center_x = (left_girt.bounding_box().min.X + right_girt.bounding_box().max.X) / 2
-    building_height = left_girt.bounding_box().max.Z
+    building_center_x = (lgx0 + rgx1) / 2
+    building_height = lgz1
     tenon_length = rafter_params.section * 2 * math.tan(math.radians(rafter_params.pitch_angle))
     # Girt section is the X extent (width of the timber cross-section)
-    girt_section = left_girt.bounding_box().max.X - left_girt.bounding_box().min.X
+    girt_section = lgx1 - lgx0
     # Top surface offset along the rafter due to pitch angle
     # Lap length: from overhang tip to inner edge of girt (where rafter top surface meets girt inner edge)
     lap_length = rafter_params.overhang + rafter_params.section / 2 * math.tan(math.radians(rafter_params.pitch_angle))
@@ -1351,14 +1664,12 @@ def build_rafter_pair(
     ).shape
     
     # Rotate left rafter (and peg together if exists)
-    left_rafter_rotated = left_rafter_with_tenon.rotate(
-        Axis.Y,
-        -rafter_params.pitch_angle,
-    )
+    left_pitch = _rotation(Axis.Y, -rafter_params.pitch_angle)
+    left_rafter_rotated = left_rafter_with_tenon.moved(left_pitch)
     if left_lap_peg is not None:
-        left_lap_peg = left_lap_peg.rotate(Axis.Y, -rafter_params.pitch_angle)
+        left_lap_peg = left_lap_peg.moved(left_pitch)
     if left_peg_hole is not None:
-        left_peg_hole = left_peg_hole.rotate(Axis.Y, -rafter_params.pitch_angle)
+        left_peg_hole = left_peg_hole.moved(left_pitch)
 
     # === RIGHT RAFTER ===
     right_rafter_beam = Beam(
@@ -1392,35 +1703,21 @@ def build_rafter_pair(
         # Cut peg hole from rafter
         right_rafter_with_lap = right_rafter_with_lap - right_peg_hole
     
-    # Rotate and position right rafter (and peg)
-    right_rafter_rotated = right_rafter_with_lap.rotate(
-        Axis.Y,
-        rafter_params.pitch_angle,
-    ).move(Location((
+    # Rotate and position right rafter (and peg): the pitch and the offset are
+    # composed into one Location and applied once per shape
+    right_pitch = _rotation(Axis.Y, rafter_params.pitch_angle)
+    right_place = _translation(
         rafter_length * math.cos(math.radians(rafter_params.pitch_angle)) - rafter_params.section * 2,
         0,
         rafter_length * math.sin(math.radians(rafter_params.pitch_angle)),
-    )))
+    ) * right_pitch
+    right_rafter_rotated = right_rafter_with_lap.moved(right_place)
     
     if right_lap_peg is not None:
-        right_lap_peg = right_lap_peg.rotate(
-            Axis.Y,
-            rafter_params.pitch_angle,
-        ).move(Location((
-            rafter_length * math.cos(math.radians(rafter_params.pitch_angle)) - rafter_params.section * 2,
-            0,
-            rafter_length * math.sin(math.radians(rafter_params.pitch_angle)),
-        )))
+        right_lap_peg = right_lap_peg.moved(right_place)
     
     if right_peg_hole is not None:
-        right_peg_hole = right_peg_hole.rotate(
-            Axis.Y,
-            rafter_params.pitch_angle,
-        ).move(Location((
-            rafter_length * math.cos(math.radians(rafter_params.pitch_angle)) - rafter_params.section * 2,
-            0,
-            rafter_length * math.sin(math.radians(rafter_params.pitch_angle)),
-        )))
+        right_peg_hole = right_peg_hole.moved(right_place)
 
     right_rafter_with_mortise = create_receiving_cut(
         positioned_insert=left_rafter_rotated,
@@ -1433,14 +1730,11 @@ def build_rafter_pair(
         length=rafter_length,
         align=(Align.MIN, Align.MIN, Align.MIN),
     )
-    left_trimbox = left_trimbox.rotate(
-        Axis.Y,
-        -rafter_params.pitch_angle,
-    ).move(Location((
+    left_trimbox = left_trimbox.moved(_translation(
         0,
         0,
         rafter_params.section * math.tan(math.radians(rafter_params.pitch_angle)) * 2
-    )))
+    ) * left_pitch)
     right_rafter_trimmed = right_rafter_with_mortise - left_trimbox
 
     right_trimbox = Box(
@@ -1449,23 +1743,20 @@ def build_rafter_pair(
         length=rafter_length,
         align=(Align.MIN, Align.MIN, Align.MIN),
     )
-    right_trimbox = right_trimbox.rotate(
-        Axis.Y,
-        rafter_params.pitch_angle,
-    ).move(Location((
-        rafter_length * math.cos(math.radians(rafter_params.pitch_angle)) - rafter_params.section * 2,      
+    right_trimbox = right_trimbox.moved(_translation(
+        rafter_length * math.cos(math.radians(rafter_params.pitch_angle)) - rafter_params.section * 2,
         0,
         rafter_length * math.sin(math.radians(rafter_params.pitch_angle)) + rafter_params.section * math.tan(math.radians(rafter_params.pitch_angle)) * 2,
-    )))
+    ) * right_pitch)
     left_after_trimmed = left_rafter_rotated - right_trimbox
 
     rafter_pair = [left_after_trimmed, right_rafter_trimmed]
-    rafter_pair_bbox = Compound(rafter_pair).bounding_box()
+    pair_x0, _, _, pair_x1, _, _ = _raw_bbox(Compound(rafter_pair))
     # Center using the midpoint of the bounding box
-    rafter_pair_center_x = (rafter_pair_bbox.min.X + rafter_pair_bbox.max.X) / 2
+    rafter_pair_center_x = (pair_x0 + pair_x1) / 2
     
     # Z position: rafter top face aligns with girt top
-    girt_top = left_girt.bounding_box().max.Z
+    girt_top = lgz1
     
     # Final positioning offset
     final_offset = Location((
@@ -1499,8 +1790,8 @@ def build_rafter_pair(
         
         # Peak peg (tongue-and-fork joint)
         peak_peg = create_peak_peg_for_rafter(
-            left_rafter_bbox=left_rafter_positioned.bounding_box(),
-            right_rafter_bbox=right_rafter_positioned.bounding_box(),
+            left_rafter_bbox=_bbox(left_rafter_positioned),
+            right_rafter_bbox=_bbox(right_rafter_positioned),
             peg_diameter=rafter_params.peg_diameter,
             peg_offset=rafter_params.peg_offset,
             pitch_angle=rafter_params.pitch_angle,
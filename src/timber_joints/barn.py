@@ -6,9 +6,9 @@ A barn frame consists of:
 - Knee braces for lateral stability (both in bents and under girts)
 """
 
-import copy
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
+import numpy as np
 from build123d import Part, Location
 
 from timber_joints.alignment import (
@@ -24,6 +24,16 @@ from timber_joints.alignment import (
 )
 
 
+# Display options by part-name keyword, checked in order (braces before girts, etc.)
+_SHOW_OPTIONS = (
+    ("brace", {"color": "orange"}),
+    ("rafter", {"color": "peru", "alpha": 0.3}),
+    ("girt", {"color": "burlywood", "alpha": 0.3}),
+    ("beam", {"color": "burlywood", "alpha": 0.3}),
+    ("post", {"color": "sienna", "alpha": 0.3}),
+)
+
+
 @dataclass
 class BarnConfig:
     """Configuration for a barn frame (all dimensions in mm)."""
@@ -145,39 +155,43 @@ class Bent:
     """A single bent (portal frame) with optional braces.
     
     This wraps BentResult with Y position information for barn assembly.
-    Note: Properties return deep copies to avoid mutation from build123d's move().
+    Note: Properties return relocated copies that share the bent's geometry,
+    so moving them never mutates the shared BentResult.
     """
     result: BentResult
     y_position: float = 0
     
+    def _at_y(self, shape: Part) -> Part:
+        return shape.moved(Location((0, self.y_position, 0)))
+    
     @property
     def left_post(self) -> Part:
         """Left post at Y position."""
-        return copy.deepcopy(self.result.left_post).move(Location((0, self.y_position, 0)))
+        return self._at_y(self.result.left_post)
     
     @property
     def right_post(self) -> Part:
         """Right post at Y position."""
-        return copy.deepcopy(self.result.right_post).move(Location((0, self.y_position, 0)))
+        return self._at_y(self.result.right_post)
     
     @property
     def beam(self) -> Part:
         """Beam at Y position."""
-        return copy.deepcopy(self.result.beam).move(Location((0, self.y_position, 0)))
+        return self._at_y(self.result.beam)
     
     @property
     def brace_left(self) -> Optional[Part]:
         """Left brace at Y position, or None."""
         if self.result.brace_left is None:
             return None
-        return copy.deepcopy(self.result.brace_left).move(Location((0, self.y_position, 0)))
+        return self._at_y(self.result.brace_left)
     
     @property
     def brace_right(self) -> Optional[Part]:
         """Right brace at Y position, or None."""
         if self.result.brace_right is None:
             return None
-        return copy.deepcopy(self.result.brace_right).move(Location((0, self.y_position, 0)))
+        return self._at_y(self.result.brace_right)
 
 
 @dataclass
@@ -237,25 +251,28 @@ class BarnFrame:
         return barn
     
     def _build_bents(self):
-        """Build all bents using build_complete_bent utility."""
+        """Build all bents using build_complete_bent utility.
+        
+        Every bent has identical geometry and only differs in Y position,
+        so the bent is built once and shared. Bent properties return
+        relocated copies, so the shared result is never mutated.
+        """
         config = self.config
-        joint_params = config.get_joint_params()
-        brace_params = config.get_bent_brace_params()
         
-        for i in range(config.num_bents):
-            bent_y = i * config.bent_spacing
-            
-            # Create bent with optional braces
-            bent_result = build_complete_bent(
-                post_height=config.post_height,
-                post_section=config.post_section,
-                beam_length=config.beam_length,
-                beam_section=config.beam_section,
-                joint_params=joint_params,
-                brace_params=brace_params,
-            )
-            
-            self.bents.append(Bent(result=bent_result, y_position=bent_y))
+        # Create bent with optional braces
+        bent_result = build_complete_bent(
+            post_height=config.post_height,
+            post_section=config.post_section,
+            beam_length=config.beam_length,
+            beam_section=config.beam_section,
+            joint_params=config.get_joint_params(),
+            brace_params=config.get_bent_brace_params(),
+        )
+        
+        y_positions = np.arange(config.num_bents) * config.bent_spacing
+        self.bents.extend(
+            Bent(result=bent_result, y_position=float(bent_y)) for bent_y in y_positions
+        )
     
     def _build_girts(self):
         """Build girts connecting all bents using add_girts_to_bents utility."""
@@ -317,46 +334,44 @@ class BarnFrame:
             rafter_params=rafter_params,
         )
     
-    def all_parts(self) -> list[tuple[Part, str]]:
-        parts = []
+    def iter_parts(self) -> Iterator[tuple[Part, str]]:
+        """Yield (part, name) tuples one at a time.
         
+        Bent parts are relocated on access, so streaming them avoids
+        holding every positioned copy in memory at once.
+        """
         for i, bent in enumerate(self.bents):
-            parts.append((bent.left_post, f"bent{i+1}_left_post"))
-            parts.append((bent.right_post, f"bent{i+1}_right_post"))
-            parts.append((bent.beam, f"bent{i+1}_beam"))
-            if bent.brace_left:
-                parts.append((bent.brace_left, f"bent{i+1}_brace_left"))
-            if bent.brace_right:
-                parts.append((bent.brace_right, f"bent{i+1}_brace_right"))
+            yield bent.left_post, f"bent{i+1}_left_post"
+            yield bent.right_post, f"bent{i+1}_right_post"
+            yield bent.beam, f"bent{i+1}_beam"
+            if bent.result.brace_left is not None:
+                yield bent.brace_left, f"bent{i+1}_brace_left"
+            if bent.result.brace_right is not None:
+                yield bent.brace_right, f"bent{i+1}_brace_right"
         
         if self.left_girt:
-            parts.append((self.left_girt, "left_girt"))
+            yield self.left_girt, "left_girt"
         if self.right_girt:
-            parts.append((self.right_girt, "right_girt"))
+            yield self.right_girt, "right_girt"
         
         for name, brace in self.girt_braces:
-            parts.append((brace, name))
+            yield brace, name
         
         for name, rafter in self.rafters:
-            parts.append((rafter, name))
-        
-        return parts
+            yield rafter, name
+    
+    def all_parts(self) -> list[tuple[Part, str]]:
+        return list(self.iter_parts())
     
     def show(self, show_object_func):
         """Display the barn frame using provided show_object function."""
-        for part, name in self.all_parts():
-            if "brace" in name.lower():
-                show_object_func(part, name=name, options={"color": "orange"})
-            elif "rafter" in name.lower():
-                show_object_func(part, name=name, options={"color": "peru", "alpha": 0.3})
-            elif "girt" in name.lower():
-                show_object_func(part, name=name, options={"color": "burlywood", "alpha": 0.3})
-            elif "beam" in name.lower():
-                show_object_func(part, name=name, options={"color": "burlywood", "alpha": 0.3})
-            elif "post" in name.lower():
-                show_object_func(part, name=name, options={"color": "sienna", "alpha": 0.3})
-            else:
+        for part, name in self.iter_parts():
+            lower = name.lower()
+            options = next((opts for key, opts in _SHOW_OPTIONS if key in lower), None)
+            if options is None:
                 show_object_func(part, name=name)
+            else:
+                show_object_func(part, name=name, options=dict(options))
     
     def summary(self) -> str:
         config = self.config
@@ -380,7 +395,7 @@ class BarnFrame:
         num_posts = len(self.bents) * 2
         num_beams = len(self.bents)
         num_girts = 2 if self.left_girt else 0
-        num_bent_braces = sum(1 for b in self.bents if b.brace_left) * 2
+        num_bent_braces = sum(1 for b in self.bents if b.result.brace_left is not None) * 2
         num_girt_braces = len(self.girt_braces)
         num_rafters = len(self.rafters)
         total = num_posts + num_beams + num_girts + num_bent_braces + num_girt_braces + num_rafters
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Union
 from build123d import Part
 from timber_joints.beam import Beam
-from timber_joints.utils import get_shape_dimensions
+from timber_joints.utils import get_shape_bbox
 
 
 @dataclass
@@ -32,9 +32,11 @@ class BaseJoint:
 
     def __post_init__(self) -> None:
         """Extract dimensions from beam."""
-        self._input_shape, self._length, self._width, self._height = get_shape_dimensions(self.beam)
+        self._input_shape, bbox = get_shape_bbox(self.beam)
+        self._length = bbox.max.X - bbox.min.X
+        self._width = bbox.max.Y - bbox.min.Y
+        self._height = bbox.max.Z - bbox.min.Z
         # Also store the actual bbox positions for correct positioning
-        bbox = self._input_shape.bounding_box()
         self._bbox_min_x = bbox.min.X
         self._bbox_max_x = bbox.max.X
     
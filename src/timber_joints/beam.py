@@ -1,7 +1,10 @@
 """Simplified Beam class for timber joints."""
 
-from dataclasses import dataclass
-from build123d import Align, Box, Part
+import copy
+from dataclasses import dataclass, field
+from typing import Optional
+from build123d import Align, BoundBox, Box, Part
+from OCP.Bnd import Bnd_Box
 
 
 @dataclass
@@ -20,6 +23,11 @@ class Beam:
     width: float
     height: float
 
+    # Template solid keyed by the dimensions it was built with
+    _shape_cache: Optional[tuple[tuple[float, float, float], Part]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Validate beam dimensions."""
         for dim, val in [("length", self.length), ("width", self.width), ("height", self.height)]:
@@ -28,13 +36,37 @@ class Beam:
 
     @property
     def shape(self) -> Part:
-        """Create the solid beam shape."""
-        return Box(
-            self.length,
-            self.width,
-            self.height,
-            align=(Align.MIN, Align.MIN, Align.MIN)
-        )
+        """Create the solid beam shape.
+
+        The box is built once per set of dimensions; each access returns a
+        shallow copy sharing its topology, so callers can still move() the
+        result without affecting the beam or each other.
+        """
+        dims = (self.length, self.width, self.height)
+        if self._shape_cache is None or self._shape_cache[0] != dims:
+            box = Box(
+                self.length,
+                self.width,
+                self.height,
+                align=(Align.MIN, Align.MIN, Align.MIN)
+            )
+            self._shape_cache = (dims, box)
+        return copy.copy(self._shape_cache[1])
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float, float, float]:
+        """Bounds of shape as (xmin, ymin, zmin, xmax, ymax, zmax), from the dimensions."""
+        return (0.0, 0.0, 0.0, self.length, self.width, self.height)
+
+    def bounding_box(self) -> BoundBox:
+        """Bounding box of shape without traversing its BRep.
+
+        Matches shape.bounding_box() exactly: the box spans the origin to
+        (length, width, height).
+        """
+        box = Bnd_Box()
+        box.Update(*self.bounds)
+        return BoundBox(box)
 
     def __repr__(self) -> str:
         return f"Beam(L={self.length}, W={self.width}, H={self.height})"
@@ -20,8 +20,8 @@ rotation they become vertical relief cuts.
 
 import math
 from dataclasses import dataclass, field
-from typing import Union, TYPE_CHECKING
-from build123d import Part, Polyline, make_face, extrude, Box, Location
+from typing import Optional, Union, TYPE_CHECKING
+from build123d import Align, Axis, Part, Plane, Polyline, make_face, extrude, Box, Location
 from numpy import angle
 from timber_joints.shouldered_tenon import ShoulderedTenon
 from timber_joints.utils import get_shape_dimensions
@@ -45,10 +45,11 @@ class BraceTenon:
     at_start: bool = True
 
     # Computed fields
-    shape: Part = field(init=False, repr=False)
+    waste: list[Part] = field(init=False, repr=False)
     rotated_cut_bbox_height: float = field(init=False, repr=False)
     rotated_cut_bbox_width: float = field(init=False, repr=False)
     tenon_height: float = field(init=False, repr=False)
+    _shape: Optional[Part] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         # Import here to avoid circular import
@@ -64,7 +65,18 @@ class BraceTenon:
                 raise ValueError("brace_angle is required when brace is a Part")
             self._brace_shape = self.brace
         
-        self.shape, self.rotated_cut_bbox_height, self.rotated_cut_bbox_width = self._create_brace_tenon()
+        self.waste, self.rotated_cut_bbox_height, self.rotated_cut_bbox_width = self._create_brace_tenon_waste()
+
+    @property
+    def shape(self) -> Part:
+        """Brace with the tenon cut; the waste is subtracted on first access.
+        
+        Callers cutting several tenons into the same brace can instead
+        subtract every joint's waste in a single boolean.
+        """
+        if self._shape is None:
+            self._shape = self._brace_shape - self.waste
+        return self._shape
 
     def _create_release_cuts(
         self, 
@@ -75,8 +87,6 @@ class BraceTenon:
         shoulder_depth: float,
     ) -> Part:
         """Create release cuts on tenon tip (rotated boxes that become vertical after brace rotation)."""
-        from build123d import Axis, Align, Plane
-        
         # Release cut box size - make it big enough
         release_size = brace_height * 2
 
@@ -106,8 +116,8 @@ class BraceTenon:
             
         return Part(release_box.wrapped)
 
-    def _create_brace_tenon(self) -> tuple[Part, float, float]:
-        """Apply shouldered tenon with full height and release cuts. Returns (shape, rotated_height, rotated_width)."""
+    def _create_brace_tenon_waste(self) -> tuple[list[Part], float, float]:
+        """Shouldered tenon (full height) and release cut waste. Returns (waste, rotated_height, rotated_width)."""
         brace_shape = self._brace_shape
         
         # Get dimensions of brace - need bounding box for position info
@@ -133,15 +143,11 @@ class BraceTenon:
             at_start=self.at_start,
         )
         
-        # Get the base shape with shoulder
-        result_shape = shouldered.shape
-        
-        # Create and apply release cuts using actual bounding box positions
+        # Create release cuts using actual bounding box positions
         release_cuts = self._create_release_cuts(
             brace_bbox.min.X, brace_bbox.max.X, brace_width, brace_height, shoulder_depth
         )
         
-        result_shape = result_shape - release_cuts
-        
-        return result_shape, shouldered.rotated_cut_bbox_height, shouldered.rotated_cut_bbox_width
+        waste = [shouldered.waste, release_cuts]
+        return waste, shouldered.rotated_cut_bbox_height, shouldered.rotated_cut_bbox_width
 
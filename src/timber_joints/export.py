@@ -23,6 +23,30 @@ ROLE_TO_IFC = {
 }
 
 
+def _placement_matrices(elements: list[Element]) -> np.ndarray:
+    """Build the (N, 4, 4) placement matrices for elements from location and rotation."""
+    matrices = np.broadcast_to(np.eye(4), (len(elements), 4, 4)).copy()
+    matrices[:, 0:3, 3] = np.array(
+        [tuple(e.location.position) for e in elements], dtype=np.float64
+    ).reshape(-1, 3)
+    
+    # Apply rotation if present
+    for i, element in enumerate(elements):
+        if element.rotation:
+            axis, angle = element.rotation
+            rad = np.radians(angle)
+            c, s = np.cos(rad), np.sin(rad)
+            if axis.direction.Z == 1:  # Z axis
+                rot = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+            elif axis.direction.Y == 1:  # Y axis
+                rot = np.array([[c, 0, s], [0, 1, 0], [-s, 0, c]])
+            else:  # X axis
+                rot = np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
+            matrices[i, 0:3, 0:3] = rot
+    
+    return matrices
+
+
 def export_frame_to_ifc(
     frame: TimberFrame,
     filename: str,
@@ -38,6 +62,9 @@ def export_frame_to_ifc(
     try:
         import ifcopenshell
         import ifcopenshell.api
+        import ifcopenshell.api.geometry
+        import ifcopenshell.api.root
+        import ifcopenshell.api.spatial
     except ImportError:
         raise ImportError("ifcopenshell not installed. Run: pip install ifcopenshell")
     
@@ -70,24 +97,37 @@ def export_frame_to_ifc(
     ifcopenshell.api.run("aggregate.assign_object", ifc,
                          products=[storey], relating_object=building)
     
+    # Placement matrices for all elements, built in one batch
+    elements = list(frame)
+    matrices = _placement_matrices(elements)
+    
+    # Resolve the per-element API calls once instead of dispatching by name
+    create_entity = ifcopenshell.api.root.create_entity
+    edit_object_placement = ifcopenshell.api.geometry.edit_object_placement
+    
+    # Identical sections share one profile; every extrusion runs along local X
+    profiles = {}
+    direction = ifc.create_entity("IfcDirection", DirectionRatios=[1.0, 0.0, 0.0])
+    
     # Export each element
-    for name, element in frame.elements.items():
+    ifc_elems = []
+    for i, element in enumerate(elements):
+        name = element.name
         ifc_class = ROLE_TO_IFC.get(element.role, "IfcMember")
         
-        ifc_elem = ifcopenshell.api.run("root.create_entity", ifc,
-                                         ifc_class=ifc_class, name=name)
-        
-        ifcopenshell.api.run("spatial.assign_container", ifc,
-                             relating_structure=storey, products=[ifc_elem])
+        ifc_elem = create_entity(ifc, ifc_class=ifc_class, name=name)
+        ifc_elems.append(ifc_elem)
         
         # Simple extruded geometry
         beam = element.beam
-        profile = ifc.create_entity("IfcRectangleProfileDef",
-                                    ProfileType="AREA",
-                                    XDim=beam.width,
-                                    YDim=beam.height)
+        section = (beam.width, beam.height)
+        profile = profiles.get(section)
+        if profile is None:
+            profile = profiles[section] = ifc.create_entity("IfcRectangleProfileDef",
+                                                            ProfileType="AREA",
+                                                            XDim=beam.width,
+                                                            YDim=beam.height)
         
-        direction = ifc.create_entity("IfcDirection", DirectionRatios=[1.0, 0.0, 0.0])
         extruded = ifc.create_entity("IfcExtrudedAreaSolid",
                                       SweptArea=profile,
                                       ExtrudedDirection=direction,
@@ -104,32 +144,17 @@ def export_frame_to_ifc(
         ifc_elem.Representation = prod_shape
         
         # Placement from element location
-        loc = element.location
-        x, y, z = loc.position.X, loc.position.Y, loc.position.Z
-        
-        # Build transformation matrix
-        matrix = np.eye(4)
-        matrix[0:3, 3] = [x, y, z]
-        
-        # Apply rotation if present
-        if element.rotation:
-            axis, angle = element.rotation
-            rad = np.radians(angle)
-            c, s = np.cos(rad), np.sin(rad)
-            if axis.direction.Z == 1:  # Z axis
-                rot = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
-            elif axis.direction.Y == 1:  # Y axis
-                rot = np.array([[c, 0, s], [0, 1, 0], [-s, 0, c]])
-            else:  # X axis
-                rot = np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
-            matrix[0:3, 0:3] = rot
-        
-        ifcopenshell.api.run("geometry.edit_object_placement", ifc,
-                             product=ifc_elem, matrix=matrix)
+        edit_object_placement(ifc, product=ifc_elem, matrix=matrices[i])
+    
+    # Contain every element in the storey with a single relationship
+    if ifc_elems:
+        ifcopenshell.api.spatial.assign_container(ifc,
+                                                  relating_structure=storey,
+                                                  products=ifc_elems)
     
     ifc.write(filename)
     print(f"IFC exported: {filename}")
-    print(f"  {len(frame.elements)} elements")
+    print(f"  {len(frame)} elements")
 
 
 def show_frame(
@@ -171,7 +196,7 @@ def show_frame(
     
     # Show combined shape
     show(frame.shape)
-    print(f"Displayed {len(frame.elements)} elements")
+    print(f"Displayed {len(frame)} elements")
 
 
 def export_beam_schedule(frame: TimberFrame, filename: str = None) -> str:
@@ -205,7 +230,7 @@ def export_beam_schedule(frame: TimberFrame, filename: str = None) -> str:
     lines.extend([
         "-" * 60,
         f"{'TOTAL':<15} {'':<10} {'':>8} {'':>6} {'':>6}  {total_volume:>10.4f} m³",
-        f"Elements: {len(frame.elements)}",
+        f"Elements: {len(frame)}",
     ])
     
     schedule = "\n".join(lines)
@@ -156,6 +156,8 @@ from .backends.calculix import (
     read_frd_nodes,
     read_frd_stresses,
     compute_von_mises,
+    displacement_extremes,
+    stress_extremes,
 )
 
 from .assembly import (
@@ -242,6 +244,8 @@ __all__ = [
     "read_frd_nodes",
     "read_frd_stresses",
     "compute_von_mises",
+    "displacement_extremes",
+    "stress_extremes",
     # Visualization
     "read_mesh_elements",
     "get_outer_faces",
@@ -37,7 +37,8 @@ from .backends.calculix import (
     run_ccx,
     read_frd_displacements,
     read_frd_stresses,
-    compute_von_mises,
+    displacement_extremes,
+    stress_extremes,
 )
 from .visualization import save_load_info, save_material_info
 from .solver import (
@@ -274,8 +275,6 @@ def analyze_assembly(
     Returns:
         AssemblyResult with FEA results
     """
-    import numpy as np
-    
     if config is None:
         config = AssemblyConfig()
     
@@ -438,28 +437,10 @@ def analyze_assembly(
     if success and frd_file.exists():
         displacements = read_frd_displacements(frd_file)
         if displacements:
-            max_total = 0.0
-            max_uz = 0.0
-            for ux, uy, uz in displacements.values():
-                total = np.sqrt(ux**2 + uy**2 + uz**2)
-                if total > max_total:
-                    max_total = total
-                if abs(uz) > abs(max_uz):
-                    max_uz = uz
+            max_total, _, _, max_uz = displacement_extremes(displacements)
             
             # Read stresses
-            max_von_mises = 0.0
-            max_stress = 0.0
-            stresses = read_frd_stresses(frd_file)
-            if stresses:
-                for sxx, syy, szz, sxy, syz, szx in stresses.values():
-                    vm = compute_von_mises(sxx, syy, szz, sxy, syz, szx)
-                    if vm > max_von_mises:
-                        max_von_mises = vm
-                    # Track max normal stress
-                    for s in (sxx, syy, szz):
-                        if s > max_stress:
-                            max_stress = s
+            max_von_mises, max_stress, _ = stress_extremes(read_frd_stresses(frd_file))
             
             fea_results = FEAResults(
                 max_displacement=max_total,
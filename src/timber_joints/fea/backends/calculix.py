@@ -435,6 +435,55 @@ def compute_von_mises(sxx: float, syy: float, szz: float,
                          + 6 * (sxy**2 + syz**2 + szx**2)))
 
 
+def _signed_abs_max(values: np.ndarray) -> float:
+    """Value with the largest magnitude (first one on ties), or 0.0."""
+    i = int(np.argmax(np.abs(values)))
+    return float(values[i]) if values[i] != 0 else 0.0
+
+
+def displacement_extremes(
+    displacements: Dict[int, tuple[float, float, float]],
+) -> tuple[float, float, float, float]:
+    """Max displacement magnitude and signed peak component of a result set.
+    
+    Returns:
+        (max_total, max_ux, max_uy, max_uz); each component is the signed
+        value with the largest magnitude. All zeros for an empty result.
+    """
+    if not displacements:
+        return 0.0, 0.0, 0.0, 0.0
+    u = np.fromiter(
+        (c for d in displacements.values() for c in d),
+        dtype=np.float64, count=3 * len(displacements),
+    ).reshape(-1, 3)
+    max_total = float(np.sqrt((u ** 2).sum(axis=1)).max())
+    return (max_total, *(_signed_abs_max(u[:, k]) for k in range(3)))
+
+
+def stress_extremes(
+    stresses: Dict[int, tuple[float, float, float, float, float, float]],
+) -> tuple[float, float, float]:
+    """Peak von Mises and normal stresses of a result set.
+    
+    Returns:
+        (max_von_mises, max_normal, min_normal), clamped so the maxima are at
+        least 0.0 and the minimum at most 0.0. All zeros for an empty result.
+    """
+    if not stresses:
+        return 0.0, 0.0, 0.0
+    s = np.fromiter(
+        (c for comps in stresses.values() for c in comps),
+        dtype=np.float64, count=6 * len(stresses),
+    ).reshape(-1, 6)
+    von_mises = compute_von_mises(*s.T)
+    normal = s[:, :3]
+    return (
+        max(0.0, float(von_mises.max())),
+        max(0.0, float(normal.max())),
+        min(0.0, float(normal.min())),
+    )
+
+
 @BackendRegistry.register
 class CalculiXBackend(BaseSolverBackend):
     """CalculiX FEA solver backend."""
@@ -743,40 +792,12 @@ class CalculiXBackend(BaseSolverBackend):
             )
         
         # Calculate max values
-        max_total = 0.0
-        max_ux = 0.0
-        max_uy = 0.0
-        max_uz = 0.0
-        
-        for ux, uy, uz in displacements.values():
-            total = np.sqrt(ux**2 + uy**2 + uz**2)
-            if total > max_total:
-                max_total = total
-            if abs(ux) > abs(max_ux):
-                max_ux = ux
-            if abs(uy) > abs(max_uy):
-                max_uy = uy
-            if abs(uz) > abs(max_uz):
-                max_uz = uz
-        
-        # Read stresses
+        max_total, max_ux, max_uy, max_uz = displacement_extremes(displacements)
+        
+        # Read stresses; max/min normal stress for timber checks
+        # (principal stresses would need eigenvalue calculation)
         stresses = read_frd_stresses(frd_file)
-        max_von_mises = 0.0
-        max_principal = 0.0
-        min_principal = 0.0
-        
-        if stresses:
-            for sxx, syy, szz, sxy, syz, szx in stresses.values():
-                vm = compute_von_mises(sxx, syy, szz, sxy, syz, szx)
-                if vm > max_von_mises:
-                    max_von_mises = vm
-                # Track max/min normal stress for timber checks
-                # (principal stresses would need eigenvalue calculation)
-                for s in (sxx, syy, szz):
-                    if s > max_principal:
-                        max_principal = s
-                    if s < min_principal:
-                        min_principal = s
+        max_von_mises, max_principal, min_principal = stress_extremes(stresses)
         
         return AnalysisResult(
             success=True,
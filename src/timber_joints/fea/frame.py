@@ -11,6 +11,7 @@ from enum import Enum, auto
 from pathlib import Path
 from typing import List, Optional, Callable, Tuple
 
+import numpy as np
 from build123d import Part
 
 from ..config import DEFAULT_CONFIG
@@ -47,6 +48,17 @@ class MemberType(Enum):
     BRACE = auto()   # Diagonal member
 
 
+# Fractions of a member's length at which its self-weight is applied
+_SELF_WEIGHT_FRACTIONS = np.array([1 / 6, 3 / 6, 5 / 6])
+
+
+# Grain orientation per member type; beams and braces default to grain along X
+_MEMBER_ORIENTATION = {
+    MemberType.POST: POST_VERTICAL_Z,
+    MemberType.GIRT: GIRT_HORIZONTAL_Y,
+}
+
+
 @dataclass
 class FrameMember:
     """A structural member in a timber frame."""
@@ -79,16 +91,12 @@ class FrameMember:
     @property
     def orientation(self) -> GrainOrientation:
         """Get grain orientation for FEA."""
-        if self.member_type == MemberType.POST:
-            return POST_VERTICAL_Z
-        elif self.member_type == MemberType.GIRT:
-            return GIRT_HORIZONTAL_Y
-        else:
-            return BEAM_HORIZONTAL_X
+        return _MEMBER_ORIENTATION.get(self.member_type, BEAM_HORIZONTAL_X)
     
     @property 
     def bbox(self):
-        return self.shape.bounding_box()
+        """Fast (non-optimal) AABB; only used for contact/load placement with margins."""
+        return self.shape.bounding_box(optimal=False)
     
     @property
     def is_post(self) -> bool:
@@ -223,6 +231,14 @@ class TimberFrame:
         
         return self._meshing_result
     
+    def _member_volumes(self) -> List[float]:
+        """Compute the volume (mm³) of every member, in member order."""
+        return [m.shape.volume for m in self.members]
+    
+    def _member_bboxes(self) -> list:
+        """Compute the bounding box of every member, in member order."""
+        return [m.bbox for m in self.members]
+    
     def _generate_self_weight_loads(self, verbose: bool = True) -> tuple[List[LoadBC], float]:
         """Generate self-weight loads for all members.
         
@@ -232,101 +248,53 @@ class TimberFrame:
         Returns:
             Tuple of (list of LoadBC, total weight in N)
         """
-        loads = []
-        total_weight = 0.0
+        volumes = np.asarray(self._member_volumes(), dtype=np.float64)
+        bounds = np.array(
+            [(tuple(b.min), tuple(b.max)) for b in self._member_bboxes()],
+            dtype=np.float64,
+        ).reshape(-1, 2, 3)
+        lo, hi = bounds[:, 0], bounds[:, 1]
+        dims = hi - lo
+        centers = (lo + hi) / 2
+        
+        # Weight per member: mm³ -> m³ -> kg -> N
+        weights = volumes / 1e9 * self.timber_density * self.GRAVITY
+        total_weight = sum(weights.tolist())
+        
+        # Load points at 1/6, 3/6, 5/6 of every extent, shape (N, 3, 3)
+        points = lo[:, None, :] + dims[:, None, :] * _SELF_WEIGHT_FRACTIONS[None, :, None]
+        
+        def make_filter(name, px, py, pz, tol=70.0, z_tol=70.0):
+            def filter_fn(nid, x, y, z, part, mesh):
+                return (part == name and 
+                        abs(x - px) < tol and 
+                        abs(y - py) < tol and 
+                        abs(z - pz) < z_tol)
+            return filter_fn
         
-        for member in self.members:
-            bbox = member.bbox
-            
-            # Calculate volume in m³ (dimensions are in mm)
-            volume_mm3 = member.shape.volume
-            volume_m3 = volume_mm3 / 1e9  # mm³ to m³
-            
-            # Calculate weight
-            mass_kg = volume_m3 * self.timber_density
-            weight_n = mass_kg * self.GRAVITY
-            total_weight += weight_n
-            
-            # Determine primary axis (longest dimension)
-            dx = bbox.max.X - bbox.min.X
-            dy = bbox.max.Y - bbox.min.Y
-            dz = bbox.max.Z - bbox.min.Z
-            
-            # Generate 3 load points along the longest axis
+        loads = []
+        for member, (dx, dy, dz), (cx, cy, _), top_z, member_points, weight_n in zip(
+            self.members, dims.tolist(), centers.tolist(), hi[:, 2].tolist(),
+            points.tolist(), weights.tolist(),
+        ):
             third_weight = weight_n / 3
-            
-            # Center coordinates
-            cx = (bbox.min.X + bbox.max.X) / 2
-            cy = (bbox.min.Y + bbox.max.Y) / 2
-            
-            if dz > dx and dz > dy:
-                # Vertical member (post) - divide along Z
-                positions = [
-                    bbox.min.Z + dz * (1/6),
-                    bbox.min.Z + dz * (3/6),
-                    bbox.min.Z + dz * (5/6),
-                ]
-                for i, pz in enumerate(positions):
-                    def make_filter(name, px, py, pz_target, tol=70.0):
-                        def filter_fn(nid, x, y, z, part, mesh):
-                            return (part == name and 
-                                    abs(x - px) < tol and 
-                                    abs(y - py) < tol and 
-                                    abs(z - pz_target) < tol)
-                        return filter_fn
-                    
-                    loads.append(LoadBC(
-                        f"{member.name}_sw_{i}",
-                        make_filter(member.name, cx, cy, pz),
-                        dof=3,
-                        total_load=-third_weight
-                    ))
-            elif dx > dy:
-                # Horizontal member along X (beam) - divide along X
-                positions = [
-                    bbox.min.X + dx * (1/6),
-                    bbox.min.X + dx * (3/6),
-                    bbox.min.X + dx * (5/6),
-                ]
-                top_z = bbox.max.Z
-                for i, px in enumerate(positions):
-                    def make_filter(name, px_target, py, pz, tol=70.0):
-                        def filter_fn(nid, x, y, z, part, mesh):
-                            return (part == name and 
-                                    abs(x - px_target) < tol and 
-                                    abs(y - py) < tol and 
-                                    abs(z - pz) < 35.0)
-                        return filter_fn
-                    
-                    loads.append(LoadBC(
-                        f"{member.name}_sw_{i}",
-                        make_filter(member.name, px, cy, top_z),
-                        dof=3,
-                        total_load=-third_weight
-                    ))
-            else:
-                # Horizontal member along Y (girt) - divide along Y
-                positions = [
-                    bbox.min.Y + dy * (1/6),
-                    bbox.min.Y + dy * (3/6),
-                    bbox.min.Y + dy * (5/6),
-                ]
-                top_z = bbox.max.Z
-                for i, py in enumerate(positions):
-                    def make_filter(name, px, py_target, pz, tol=70.0):
-                        def filter_fn(nid, x, y, z, part, mesh):
-                            return (part == name and 
-                                    abs(x - px) < tol and 
-                                    abs(y - py_target) < tol and 
-                                    abs(z - pz) < 35.0)
-                        return filter_fn
-                    
-                    loads.append(LoadBC(
-                        f"{member.name}_sw_{i}",
-                        make_filter(member.name, cx, py, top_z),
-                        dof=3,
-                        total_load=-third_weight
-                    ))
+            for i, (px, py, pz) in enumerate(member_points):
+                if dz > dx and dz > dy:
+                    # Vertical member (post) - divide along Z
+                    node_filter = make_filter(member.name, cx, cy, pz)
+                elif dx > dy:
+                    # Horizontal member along X (beam) - divide along X, load the top
+                    node_filter = make_filter(member.name, px, cy, top_z, z_tol=35.0)
+                else:
+                    # Horizontal member along Y (girt) - divide along Y, load the top
+                    node_filter = make_filter(member.name, cx, py, top_z, z_tol=35.0)
+                
+                loads.append(LoadBC(
+                    f"{member.name}_sw_{i}",
+                    node_filter,
+                    dof=3,
+                    total_load=-third_weight
+                ))
         
         if verbose:
             print(f"Self-weight: {total_weight / self.GRAVITY:.1f} kg ({total_weight:.1f} N)")
@@ -345,9 +313,11 @@ class TimberFrame:
         # Use larger margin - tenons extend into posts, and mesh_size affects detection
         margin = 100.0  # mm - generous to catch all joints
         
+        bboxes = self._member_bboxes()
         for i, m1 in enumerate(self.members):
-            for m2 in self.members[i+1:]:
-                if self._bboxes_overlap(m1.bbox, m2.bbox, margin):
+            for j in range(i + 1, len(self.members)):
+                m2 = self.members[j]
+                if self._bboxes_overlap(bboxes[i], bboxes[j], margin):
                     # Slave surface (part_a) = tenon side (beam or brace)
                     # Master surface (part_b) = mortise side (post or beam)
                     # Priority: POST > BEAM > BRACE (posts are always master)
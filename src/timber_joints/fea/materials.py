@@ -28,9 +28,11 @@ Example::
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import subprocess
+import numpy as np
 
 
 class MaterialModel(Enum):
@@ -92,7 +94,7 @@ BRACE_DIAGONAL = GrainOrientation(
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ElasticConstants:
     """Orthotropic elastic constants for timber.
     
@@ -115,9 +117,38 @@ class ElasticConstants:
     nu_LR: float  # Strain in R from stress in L
     nu_LT: float  # Strain in T from stress in L
     nu_RT: float  # Strain in T from stress in R
-
-
-@dataclass
+    
+    def compliance_matrix(self) -> np.ndarray:
+        """6x6 orthotropic compliance matrix S in material axes.
+        
+        Voigt order is (LL, RR, TT, RT, LT, LR) with engineering shear strains.
+        """
+        S = np.zeros((6, 6))
+        S[0, 0] = 1.0 / self.E_L
+        S[1, 1] = 1.0 / self.E_R
+        S[2, 2] = 1.0 / self.E_T
+        S[0, 1] = S[1, 0] = -self.nu_LR / self.E_L
+        S[0, 2] = S[2, 0] = -self.nu_LT / self.E_L
+        S[1, 2] = S[2, 1] = -self.nu_RT / self.E_R
+        S[3, 3] = 1.0 / self.G_RT
+        S[4, 4] = 1.0 / self.G_LT
+        S[5, 5] = 1.0 / self.G_LR
+        return S
+    
+    def stiffness_matrix(self) -> np.ndarray:
+        """6x6 orthotropic stiffness matrix C = S^-1 (same Voigt order as compliance)."""
+        return np.linalg.inv(self.compliance_matrix())
+
+
+@lru_cache(maxsize=128)
+def _voigt_of(elastic: ElasticConstants) -> np.ndarray:
+    """Stiffness matrix per distinct set of elastic constants."""
+    C = elastic.stiffness_matrix()
+    C.flags.writeable = False
+    return C
+
+
+@dataclass(frozen=True, slots=True)
 class StrengthProperties:
     """Characteristic strength values for timber (EN 338).
     
@@ -171,6 +202,16 @@ class TimberMaterial(ABC):
         """Density in kg/m³."""
         pass
     
+    @property
+    def C_voigt(self) -> np.ndarray:
+        """Voigt stiffness matrix of the elastic constants (read-only).
+        
+        Solvers given ENGINEERING CONSTANTS invert the compliance themselves;
+        this cached copy is for parameter sweeps and vectorized assembly that
+        need C directly. It is shared by every material with equal constants.
+        """
+        return _voigt_of(self.elastic)
+    
     @property
     def model_type(self) -> MaterialModel:
         """Type of constitutive model (default: elastic)."""
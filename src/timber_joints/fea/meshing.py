@@ -1,6 +1,7 @@
 """Mesh generation utilities for timber FEA using gmsh."""
 
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
 from typing import Optional, List, Tuple, Dict
 import gmsh
@@ -39,6 +40,7 @@ def mesh_part(
     part_name: str,
     mesh_size: float,
     refinement_boxes: Optional[list[RefinementBox]] = None,
+    num_threads: int = 0,
 ) -> MeshResult:
     """Mesh a single part and return nodes, elements, and surface info.
     
@@ -47,12 +49,20 @@ def mesh_part(
         part_name: Name for the mesh model
         mesh_size: Base mesh size
         refinement_boxes: List of RefinementBox for local refinement
+        num_threads: Threads for gmsh curve/surface meshing (0 = all cores)
         
     Returns:
         MeshResult with nodes, elements, and surface information
     """
     gmsh.initialize()
     gmsh.option.setNumber("General.Terminal", 0)
+    # Curves and surfaces are meshed independently, so gmsh can spread them
+    # over threads. General.NumThreads is also the default for the 3D step, so
+    # pin that to one thread to keep the 3D Delaunay single-threaded
+    gmsh.option.setNumber("General.NumThreads", num_threads)
+    gmsh.option.setNumber("Mesh.MaxNumThreads1D", num_threads)
+    gmsh.option.setNumber("Mesh.MaxNumThreads2D", num_threads)
+    gmsh.option.setNumber("Mesh.MaxNumThreads3D", 1)
     gmsh.model.add(part_name)
     
     gmsh.model.occ.importShapes(step_file)
@@ -86,24 +96,17 @@ def mesh_part(
     
     gmsh.model.mesh.generate(3)
     
-    # Get nodes
+    # Get nodes (gmsh returns flat arrays; reshape instead of looping per node)
     node_tags, node_coords, _ = gmsh.model.mesh.getNodes()
-    nodes = {}
-    for i, tag in enumerate(node_tags):
-        nodes[int(tag)] = (
-            node_coords[3*i],
-            node_coords[3*i + 1],
-            node_coords[3*i + 2]
-        )
+    coords = np.asarray(node_coords, dtype=np.float64).reshape(-1, 3)
+    nodes = dict(zip(np.asarray(node_tags, dtype=np.int64).tolist(), map(tuple, coords.tolist())))
     
     # Get C3D4 elements (4-node tetrahedra)
     elem_types, _, elem_node_tags = gmsh.model.mesh.getElements(dim=3)
     elements = []
     for i, elem_type in enumerate(elem_types):
         if elem_type == 4:  # C3D4
-            tags = elem_node_tags[i]
-            for j in range(0, len(tags), 4):
-                elements.append([int(tags[j+k]) for k in range(4)])
+            elements.extend(np.asarray(elem_node_tags[i], dtype=np.int64).reshape(-1, 4).tolist())
     
     # Get surface faces for contact
     surfaces = gmsh.model.getEntities(dim=2)
@@ -113,9 +116,7 @@ def mesh_part(
         faces = []
         for i, et in enumerate(elem_types_s):
             if et == 2:  # 3-node triangles
-                tags = elem_node_tags_s[i]
-                for j in range(0, len(tags), 3):
-                    faces.append([int(tags[j+k]) for k in range(3)])
+                faces.extend(np.asarray(elem_node_tags_s[i], dtype=np.int64).reshape(-1, 3).tolist())
         if faces:
             surface_elements[tag] = faces
     
@@ -184,24 +185,44 @@ def get_boundary_faces(
     Returns:
         List of (element_id, face_number) for boundary faces
     """
-    face_node_indices = [(0, 1, 2), (0, 1, 3), (1, 2, 3), (0, 2, 3)]
-    face_count = {}
+    return list(_faces_seen_once(elements).values())
+
+
+def _face_keys(sorted_faces: np.ndarray) -> np.ndarray:
+    """One integer key per sorted (n1, n2, n3) node triple.
     
-    for elem_id, elem_nodes in elements:
-        for face_idx, (i, j, k) in enumerate(face_node_indices):
-            n1, n2, n3 = elem_nodes[i], elem_nodes[j], elem_nodes[k]
-            face_key = tuple(sorted([n1, n2, n3]))
-            if face_key not in face_count:
-                face_count[face_key] = []
-            face_count[face_key].append((elem_id, face_idx + 1))
+    Node ids below 2**21 are packed into a single int64 so faces compare as
+    scalars; larger ids fall back to ranking the rows.
+    """
+    if len(sorted_faces) and sorted_faces.min() >= 0 and sorted_faces.max() < (1 << 21):
+        return (sorted_faces[:, 0] << 42) | (sorted_faces[:, 1] << 21) | sorted_faces[:, 2]
+    return np.unique(sorted_faces, axis=0, return_inverse=True)[1].reshape(-1)
+
+
+def _faces_seen_once(
+    elements: list[tuple[int, list[int]]],
+) -> dict[tuple[int, int, int], tuple[int, int]]:
+    """Map each boundary face's sorted node triple to its (element_id, face_number).
+    
+    All element faces are built as one array and each sorted node triple is
+    reduced to a single integer key, so one np.unique pass finds the faces
+    that occur exactly once. Boundary faces stay in order of first appearance.
+    """
+    if not elements:
+        return {}
     
-    # Return only boundary faces (appear once)
-    return [
-        (eid, fnum) 
-        for key, occs in face_count.items() 
-        if len(occs) == 1 
-        for eid, fnum in occs
-    ]
+    elem_ids = np.fromiter((elem_id for elem_id, _ in elements), dtype=np.int64, count=len(elements))
+    connectivity = np.array([elem_nodes for _, elem_nodes in elements], dtype=np.int64).reshape(-1, 4)
+    # Faces in (element, face) order, so face row r is face r % 4 of element r // 4
+    faces = np.sort(connectivity[:, C3D4_FACE_NODE_INDICES].reshape(-1, 3), axis=1)
+    
+    _, first, counts = np.unique(_face_keys(faces), return_index=True, return_counts=True)
+    keep = np.sort(first[counts == 1])
+    
+    return dict(zip(
+        map(tuple, faces[keep].tolist()),
+        zip(elem_ids[keep // 4].tolist(), (keep % 4 + 1).tolist()),
+    ))
 
 
 @dataclass
@@ -239,15 +260,14 @@ def combine_meshes(
         element_offsets[part_name] = current_elem_offset
         
         # Add nodes with offset
-        for nid, coords in mesh.nodes.items():
-            all_nodes[nid + current_node_offset] = coords
+        node_ids = np.fromiter(mesh.nodes.keys(), dtype=np.int64, count=len(mesh.nodes))
+        all_nodes.update(zip((node_ids + current_node_offset).tolist(), mesh.nodes.values()))
         
-        # Add elements with offset and track element set
-        elem_ids = []
-        for i, elem in enumerate(mesh.elements):
-            elem_id = i + 1 + current_elem_offset
-            elem_ids.append(elem_id)
-            all_elements.append((elem_id, [n + current_node_offset for n in elem]))
+        # Add elements with offset (one array add over the connectivity) and track element set
+        elem_ids = list(range(current_elem_offset + 1, current_elem_offset + len(mesh.elements) + 1))
+        if mesh.elements:
+            connectivity = np.asarray(mesh.elements, dtype=np.int64) + current_node_offset
+            all_elements.extend(zip(elem_ids, connectivity.tolist()))
         
         element_sets[part_name] = elem_ids
         
@@ -360,6 +380,15 @@ def build_mesh_faces_compound(
     compound = TopoDS_Compound()
     builder.MakeCompound(compound)
     
+    # Adjacent faces share nodes; convert each node to a gp_Pnt only once
+    points: dict[int, gp_Pnt] = {}
+    
+    def point(nid: int) -> gp_Pnt:
+        pnt = points.get(nid)
+        if pnt is None:
+            pnt = points[nid] = gp_Pnt(*nodes[nid])
+        return pnt
+    
     for elem_id, face_num in mesh_faces:
         if elem_id not in elem_dict:
             continue
@@ -370,9 +399,7 @@ def build_mesh_faces_compound(
         if n1 not in nodes or n2 not in nodes or n3 not in nodes:
             continue
         
-        p1 = gp_Pnt(*nodes[n1])
-        p2 = gp_Pnt(*nodes[n2])
-        p3 = gp_Pnt(*nodes[n3])
+        p1, p2, p3 = point(n1), point(n2), point(n3)
         
         try:
             polygon = BRepBuilderAPI_MakePolygon(p1, p2, p3, True)
@@ -419,27 +446,15 @@ def find_mesh_contact_faces(
         Tuple of (faces_a, faces_b) where each is a list of (element_id, face_number)
         for CalculiX ``*SURFACE`` definition. Face numbers are 1-4 for C3D4 elements.
     """
-    def get_face_centroid(face_nodes, nodes):
-        """Get centroid of a triangular face."""
-        coords = [nodes[nid] for nid in face_nodes if nid in nodes]
-        if len(coords) != 3:
-            return None
-        return (
-            (coords[0][0] + coords[1][0] + coords[2][0]) / 3,
-            (coords[0][1] + coords[1][1] + coords[2][1]) / 3,
-            (coords[0][2] + coords[1][2] + coords[2][2]) / 3,
-        )
-    
     def get_mesh_bbox(nodes: dict):
         """Get bounding box of mesh nodes."""
-        coords = list(nodes.values())
-        if not coords:
+        if not nodes:
             return None
-        return (
-            min(c[0] for c in coords), max(c[0] for c in coords),
-            min(c[1] for c in coords), max(c[1] for c in coords),
-            min(c[2] for c in coords), max(c[2] for c in coords),
-        )
+        coords = np.fromiter(
+            chain.from_iterable(nodes.values()), dtype=np.float64, count=3 * len(nodes)
+        ).reshape(-1, 3)
+        lo, hi = coords.min(axis=0).tolist(), coords.max(axis=0).tolist()
+        return (lo[0], hi[0], lo[1], hi[1], lo[2], hi[2])
     
     def bbox_intersection(bbox_a, bbox_b, expand):
         """Find intersection of two bounding boxes, expanded by margin."""
@@ -454,11 +469,31 @@ def find_mesh_contact_faces(
             return None
         return (min_x, max_x, min_y, max_y, min_z, max_z)
     
-    def point_in_bbox(point, bbox):
-        """Check if point is inside bounding box."""
-        return (bbox[0] <= point[0] <= bbox[1] and
-                bbox[2] <= point[1] <= bbox[3] and
-                bbox[4] <= point[2] <= bbox[5])
+    def faces_with_centroid_in_bbox(boundary: dict, nodes: dict, bbox):
+        """Boundary faces whose centroid lies inside bbox, and those centroids.
+        
+        Corner coordinates are gathered once and all centroids are computed
+        and tested in single array passes. Faces with a node missing from
+        nodes are skipped.
+        """
+        face_keys = list(boundary)
+        if not face_keys:
+            return [], np.empty((0, 3))
+        missing = (np.nan, np.nan, np.nan)
+        corner_coords = [
+            nodes.get(nid, missing) for face_nodes in boundary.values() for nid in face_nodes
+        ]
+        corners = np.fromiter(
+            chain.from_iterable(corner_coords), dtype=np.float64, count=3 * len(corner_coords)
+        ).reshape(-1, 3, 3)
+        known = ~np.isnan(corners).any(axis=(1, 2))
+        centroids = (corners[:, 0] + corners[:, 1] + corners[:, 2]) / 3
+        
+        lo = np.array(bbox[0::2])
+        hi = np.array(bbox[1::2])
+        inside = known & ((centroids >= lo) & (centroids <= hi)).all(axis=1)
+        keep = np.flatnonzero(inside)
+        return [face_keys[i] for i in keep.tolist()], centroids[keep]
     
     # Use pre-computed boundary faces if provided, otherwise compute
     if boundary_faces_a is None:
@@ -493,34 +528,18 @@ def find_mesh_contact_faces(
         return [], []
     
     # Get face centroids only for faces in the intersection region
-    candidate_faces_a = []
-    candidate_centroids_a = []
-    for face_key, face_nodes in boundary_a.items():
-        centroid = get_face_centroid(face_nodes, nodes_a)
-        if centroid and point_in_bbox(centroid, intersection):
-            candidate_faces_a.append(face_key)
-            candidate_centroids_a.append(centroid)
-    
-    candidate_faces_b = []
-    candidate_centroids_b = []
-    for face_key, face_nodes in boundary_b.items():
-        centroid = get_face_centroid(face_nodes, nodes_b)
-        if centroid and point_in_bbox(centroid, intersection):
-            candidate_faces_b.append(face_key)
-            candidate_centroids_b.append(centroid)
+    candidate_faces_a, centroids_a_np = faces_with_centroid_in_bbox(boundary_a, nodes_a, intersection)
+    candidate_faces_b, centroids_b_np = faces_with_centroid_in_bbox(boundary_b, nodes_b, intersection)
     
     if verbose:
         print(f"  Candidates in bbox intersection: {len(candidate_faces_a)} from A, {len(candidate_faces_b)} from B")
     
-    if not candidate_centroids_a or not candidate_centroids_b:
+    if not candidate_faces_a or not candidate_faces_b:
         if verbose:
             print("  No candidate faces in intersection region!")
         return [], []
     
     # Stage 2: Fine filter using KD-tree distance
-    centroids_a_np = np.array(candidate_centroids_a)
-    centroids_b_np = np.array(candidate_centroids_b)
-    
     tree_a = cKDTree(centroids_a_np)
     tree_b = cKDTree(centroids_b_np)
     
@@ -551,24 +570,7 @@ def get_boundary_faces_dict(elements: List[Tuple[int, List[int]]]) -> dict:
     
     This is a performance-critical function - compute once per mesh and reuse.
     """
-    face_count = {}
-    
-    for elem_id, elem_nodes in elements:
-        for face_idx, (i, j, k) in enumerate(C3D4_FACE_NODE_INDICES):
-            n1, n2, n3 = elem_nodes[i], elem_nodes[j], elem_nodes[k]
-            face_key = tuple(sorted([n1, n2, n3]))
-            if face_key not in face_count:
-                face_count[face_key] = []
-            face_count[face_key].append((elem_id, face_idx + 1))
-    
-    # Boundary faces appear exactly once
-    boundary_faces = {}
-    for face_key, occurrences in face_count.items():
-        if len(occurrences) == 1:
-            elem_id, face_num = occurrences[0]
-            boundary_faces[(elem_id, face_num)] = face_key
-    
-    return boundary_faces
+    return {occurrence: face_key for face_key, occurrence in _faces_seen_once(elements).items()}
 
 
 # =============================================================================
@@ -697,12 +699,16 @@ def mesh_parts_with_contact_refinement(
     
     fine_meshes = {}
     for part_name, step_file in step_files.items():
-        fine_meshes[part_name] = mesh_part(
-            step_file,
-            part_name.lower(),
-            config.element_size,
-            refinement_boxes[part_name] or None,
-        )
+        if not refinement_boxes[part_name]:
+            # Same file and mesh size as pass 1 - reuse the coarse mesh
+            fine_meshes[part_name] = coarse_meshes[part_name]
+        else:
+            fine_meshes[part_name] = mesh_part(
+                step_file,
+                part_name.lower(),
+                config.element_size,
+                refinement_boxes[part_name],
+            )
         if verbose:
             m = fine_meshes[part_name]
             print(f"  {part_name}: {m.num_nodes} nodes, {m.num_elements} elements")
@@ -716,9 +722,13 @@ def mesh_parts_with_contact_refinement(
     fine_boundary_faces = {}
     fine_elems = {}  # Cache element lists to avoid recreating for each contact
     for part_name, mesh in fine_meshes.items():
-        elems = [(i + 1, e) for i, e in enumerate(mesh.elements)]
-        fine_elems[part_name] = elems
-        fine_boundary_faces[part_name] = get_boundary_faces_dict(elems)
+        if mesh is coarse_meshes[part_name]:
+            fine_elems[part_name] = coarse_elems[part_name]
+            fine_boundary_faces[part_name] = coarse_boundary_faces[part_name]
+        else:
+            elems = [(i + 1, e) for i, e in enumerate(mesh.elements)]
+            fine_elems[part_name] = elems
+            fine_boundary_faces[part_name] = get_boundary_faces_dict(elems)
         if verbose:
             print(f"    {part_name}: {len(fine_boundary_faces[part_name])} boundary faces")
     
@@ -1,11 +1,13 @@
 """FEA visualization utilities for 3D Viewer for VSCode via GLTF export."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import json
 import numpy as np
 
 from .backends.calculix import read_frd_nodes, read_frd_displacements, read_frd_stresses, compute_von_mises
+from .meshing import _face_keys
 from .materials import get_default_material
 
 # Import trimesh for mesh export with vertex colors
@@ -300,43 +302,38 @@ def get_outer_faces(
     Returns:
         List of (n1, n2, n3) node tuples for boundary faces
     """
-    face_data = {}
+    if not elements:
+        return []
     
-    for elem_idx, elem in enumerate(elements):
-        for face_idx, (i, j, k) in enumerate(C3D4_FACE_INDICES):
-            n1, n2, n3 = elem[i], elem[j], elem[k]
-            face_key = tuple(sorted([n1, n2, n3]))
-            
-            if face_key in face_data:
-                face_data[face_key] = None  # Shared face
-            else:
-                opposite_node = elem[face_idx]
-                face_data[face_key] = (n1, n2, n3, opposite_node)
+    elems = np.asarray(elements, dtype=np.int64).reshape(-1, 4)
+    # All element faces in (element, face) order, with the node opposite each
+    faces = elems[:, C3D4_FACE_INDICES].reshape(-1, 3)
+    opposite = elems.reshape(-1)
     
-    boundary_faces = []
-    for face_key, data in face_data.items():
-        if data is not None:
-            n1, n2, n3, opposite_node = data
-            
-            if nodes is not None and all(n in nodes for n in [n1, n2, n3, opposite_node]):
-                p1 = np.array(nodes[n1])
-                p2 = np.array(nodes[n2])
-                p3 = np.array(nodes[n3])
-                face_center = (p1 + p2 + p3) / 3
-                
-                v1 = p2 - p1
-                v2 = p3 - p1
-                normal = np.cross(v1, v2)
-                
-                opposite_pt = np.array(nodes[opposite_node])
-                outward_dir = face_center - opposite_pt
-                
-                if np.dot(normal, outward_dir) < 0:
-                    n1, n2, n3 = n1, n3, n2
-            
-            boundary_faces.append((n1, n2, n3))
+    # Boundary faces are the ones whose sorted node triple occurs once;
+    # keep them in order of first appearance
+    _, first, counts = np.unique(
+        _face_keys(np.sort(faces, axis=1)), return_index=True, return_counts=True
+    )
+    keep = np.sort(first[counts == 1])
+    faces, opposite = faces[keep], opposite[keep]
+    
+    if nodes is not None:
+        # Flip faces whose normal points towards the opposite node
+        ids = np.concatenate([faces, opposite[:, None]], axis=1)
+        known = np.array([all(n in nodes for n in row) for row in ids.tolist()], dtype=bool)
+        if known.any():
+            pts = np.array(
+                [[nodes[n] for n in row] for row in ids[known].tolist()], dtype=np.float64
+            )
+            p1, p2, p3, opposite_pt = pts[:, 0], pts[:, 1], pts[:, 2], pts[:, 3]
+            normal = np.cross(p2 - p1, p3 - p1)
+            outward_dir = (p1 + p2 + p3) / 3 - opposite_pt
+            flip = np.zeros(len(faces), dtype=bool)
+            flip[known] = (normal * outward_dir).sum(axis=1) < 0
+            faces[flip] = faces[flip][:, [0, 2, 1]]
     
-    return boundary_faces
+    return list(map(tuple, faces.tolist()))
 
 
 def apply_displacements(
@@ -364,6 +361,40 @@ def apply_displacements(
     return deformed
 
 
+@lru_cache(maxsize=8)
+def _arrow_template(
+    arrow_length: float,
+    shaft_radius: float,
+    head_radius: float,
+    head_length: float,
+) -> "trimesh.Trimesh":
+    """Arrow along +Z with its base at the origin; callers must copy it."""
+    # Create shaft (cylinder) and head (cone) using trimesh primitives
+    shaft_length = arrow_length - head_length
+    
+    # Create cylinder for shaft - centered at origin along Z
+    shaft = trimesh.creation.cylinder(
+        radius=shaft_radius,
+        height=shaft_length,
+        sections=16,
+    )
+    # Shaft is centered, move so bottom is at z=0
+    shaft.apply_translation([0, 0, shaft_length / 2])
+    
+    # Create cone for head - tip at top
+    head = trimesh.creation.cone(
+        radius=head_radius,
+        height=head_length,
+        sections=16,
+    )
+    # Cone is created with base at z=0 and tip at z=height
+    # Move so base connects to top of shaft
+    head.apply_translation([0, 0, shaft_length])
+    
+    # Combine shaft and head
+    return trimesh.util.concatenate([shaft, head])
+
+
 def build_arrow_mesh(
     position: Tuple[float, float, float],
     direction: Tuple[float, float, float],
@@ -409,30 +440,8 @@ def build_arrow_mesh(
     # FEA Y -> Viewer Z, FEA Z -> Viewer Y
     dir_viewer = np.array([dx, dz, dy])
     
-    # Create shaft (cylinder) and head (cone) using trimesh primitives
-    shaft_length = arrow_length - head_length
-    
-    # Create cylinder for shaft - centered at origin along Z
-    shaft = trimesh.creation.cylinder(
-        radius=shaft_radius,
-        height=shaft_length,
-        sections=16,
-    )
-    # Shaft is centered, move so bottom is at z=0
-    shaft.apply_translation([0, 0, shaft_length / 2])
-    
-    # Create cone for head - tip at top
-    head = trimesh.creation.cone(
-        radius=head_radius,
-        height=head_length,
-        sections=16,
-    )
-    # Cone is created with base at z=0 and tip at z=height
-    # Move so base connects to top of shaft
-    head.apply_translation([0, 0, shaft_length])
-    
-    # Combine shaft and head
-    arrow = trimesh.util.concatenate([shaft, head])
+    # Arrow primitives are identical for every load; only the placement differs
+    arrow = _arrow_template(arrow_length, shaft_radius, head_radius, head_length).copy()
     
     # Calculate rotation matrix to align +Z axis with viewer direction vector
     z_axis = np.array([0, 0, 1])
@@ -642,49 +651,38 @@ def export_fea_combined_gltf(
         use_per_node_limits = isinstance(limit_or_limits, dict)
         single_limit = limit_or_limits if not use_per_node_limits else None
         
-        node_to_vertex = {}
-        vertices = []
-        colors = []
+        # Deduplicate face nodes into a compact vertex list in one pass;
+        # faces referencing nodes without coordinates are dropped
+        face_arr = np.asarray(outer_faces, dtype=np.int64).reshape(-1, 3)
+        known_ids = np.fromiter(node_coords.keys(), dtype=np.int64, count=len(node_coords))
+        face_arr = face_arr[np.isin(face_arr, known_ids).all(axis=1)]
+        vertex_nids, inverse = np.unique(face_arr, return_inverse=True)
         
-        for face in outer_faces:
-            for nid in face:
-                if nid not in node_to_vertex:
-                    if nid not in node_coords:
-                        continue
-                    x, y, z = node_coords[nid]
-                    
-                    # Apply unit scale and swap Y/Z, add X offset
-                    xs = (x - center_x) * unit_scale + x_offset
-                    ys = z * unit_scale
-                    zs = y * unit_scale
-                    
-                    # Get color
-                    if default_color is not None:
-                        rgba = default_color
-                    else:
-                        value = node_values.get(nid, 0.0)
-                        if use_per_node_limits:
-                            limit = limit_or_limits.get(nid, fallback_stress_limit)
-                        else:
-                            limit = single_limit
-                        hex_color = value_to_limit_color(value, limit)
-                        rgba = hex_to_rgba_int(hex_color, alpha=alpha)
-                    
-                    vertex_idx = len(vertices)
-                    node_to_vertex[nid] = vertex_idx
-                    vertices.append([xs, ys, zs])
-                    colors.append(rgba)
+        # Apply unit scale and swap Y/Z, add X offset
+        xyz = np.array([node_coords[nid] for nid in vertex_nids.tolist()], dtype=np.float64).reshape(-1, 3)
+        vertices_np = np.column_stack((
+            (xyz[:, 0] - center_x) * unit_scale + x_offset,
+            xyz[:, 2] * unit_scale,
+            xyz[:, 1] * unit_scale,
+        ))
         
-        # Build faces with reversed winding for correct normals
-        faces = []
-        for n1, n2, n3 in outer_faces:
-            if n1 in node_to_vertex and n2 in node_to_vertex and n3 in node_to_vertex:
-                v1, v2, v3 = node_to_vertex[n1], node_to_vertex[n2], node_to_vertex[n3]
-                faces.append([v1, v3, v2])  # Reversed winding
+        # Get colors
+        if default_color is not None:
+            colors = [default_color] * len(vertex_nids)
+        else:
+            colors = []
+            for nid in vertex_nids.tolist():
+                value = node_values.get(nid, 0.0)
+                if use_per_node_limits:
+                    limit = limit_or_limits.get(nid, fallback_stress_limit)
+                else:
+                    limit = single_limit
+                hex_color = value_to_limit_color(value, limit)
+                colors.append(hex_to_rgba_int(hex_color, alpha=alpha))
         
-        vertices_np = np.array(vertices, dtype=np.float64)
-        faces_np = np.array(faces, dtype=np.int64)
-        colors_np = np.array(colors, dtype=np.uint8)
+        # Build faces with reversed winding for correct normals
+        faces_np = inverse.reshape(-1, 3)[:, [0, 2, 1]].astype(np.int64)
+        colors_np = np.array(colors, dtype=np.uint8).reshape(-1, 4)
         
         mesh = trimesh.Trimesh(
             vertices=vertices_np,
@@ -756,21 +754,9 @@ def export_fea_combined_gltf(
             )
             if arrow_disp:
                 scene.add_geometry(arrow_disp, node_name=f"load_disp_{i}")
-            
-            # Add arrow to stress view (right, offset = spacing)
-            arrow_stress = build_arrow_mesh(
-                position=pos,
-                direction=direction,
-                arrow_length=arrow_length,
-                shaft_radius=shaft_radius,
-                head_radius=head_radius,
-                head_length=head_length,
-                color=(255, 50, 50, 255),  # Red
-                unit_scale=unit_scale,
-                center_x=center_x,
-            )
-            if arrow_stress:
-                # Offset to stress position
+                
+                # Same arrow in the stress view (right, offset = spacing)
+                arrow_stress = arrow_disp.copy()
                 arrow_stress.apply_translation([spacing, 0, 0])
                 scene.add_geometry(arrow_stress, node_name=f"load_stress_{i}")
     
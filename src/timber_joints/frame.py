@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from build123d import Part, Location, Axis, Compound
 
 from timber_joints.beam import Beam
@@ -37,14 +37,27 @@ class Element:
     role: Role
     location: Location = field(default_factory=lambda: Location((0, 0, 0)))
     rotation: tuple[Axis, float] = None  # Optional rotation (axis, degrees)
-    shape: Part = field(init=False, repr=False)
+    _shape: Optional[Part] = field(default=None, init=False, repr=False)
     
-    def __post_init__(self):
-        self.shape = self.beam.shape
-        if self.rotation:
-            axis, angle = self.rotation
-            self.shape = self.shape.rotate(axis, angle)
-        self.shape = self.shape.move(self.location)
+    @property
+    def shape(self) -> Part:
+        """Placed solid, built on first access.
+        
+        Consumers that only need dimensions and placement (IFC extrusions,
+        beam schedules) read `beam` and `location` and never trigger the
+        BRep construction.
+        """
+        if self._shape is None:
+            shape = self.beam.shape
+            if self.rotation:
+                axis, angle = self.rotation
+                shape = shape.rotate(axis, angle)
+            self._shape = shape.move(self.location)
+        return self._shape
+    
+    @shape.setter
+    def shape(self, value: Part) -> None:
+        self._shape = value
     
     @classmethod
     def post(cls, name: str, length: float, width: float, height: float,
@@ -85,11 +98,27 @@ class TimberFrame:
     name: str = "Frame"
     elements: dict[str, Element] = field(default_factory=dict)
     joints: list[Joint] = field(default_factory=list)
+    # Bumped on every geometry change; keys the cached compound in `shape`
+    _version: int = field(default=0, init=False, repr=False)
+    _compound_cache: Optional[tuple[int, Part]] = field(default=None, init=False, repr=False)
     
     def add(self, element: Element) -> "TimberFrame":
         self.elements[element.name] = element
+        self._version += 1
         return self
     
+    def add_elements(self, elements: Iterable[Element]) -> "TimberFrame":
+        """Add several elements in one dict update."""
+        self.elements.update((e.name, e) for e in elements)
+        self._version += 1
+        return self
+    
+    def __iter__(self) -> Iterator[Element]:
+        return iter(self.elements.values())
+    
+    def __len__(self) -> int:
+        return len(self.elements)
+    
     def add_post(self, name: str, length: float, width: float, height: float,
                  x: float = 0, y: float = 0, z: float = 0) -> "TimberFrame":
         elem = Element.post(name, length, width, height, Location((x, y, z)))
@@ -240,18 +269,31 @@ class TimberFrame:
             tenon_length=tenon_length,
         )
         self.joints.append(joint)
+        self._version += 1
         
         return self
     
     @property
     def shape(self) -> Part:
+        """Compound of all element shapes, cached until the frame changes.
+        
+        Element shapes modified directly (outside add/join methods) are not
+        tracked; call invalidate() after doing so.
+        """
         if not self.elements:
             return Part()
-        shapes = [e.shape for e in self.elements.values()]
-        return Compound(shapes)
+        if self._compound_cache is not None and self._compound_cache[0] == self._version:
+            return self._compound_cache[1]
+        compound = Compound([e.shape for e in self])
+        self._compound_cache = (self._version, compound)
+        return compound
+    
+    def invalidate(self) -> None:
+        """Drop cached geometry after elements were modified externally."""
+        self._version += 1
     
     def by_role(self, role: Role) -> list[Element]:
-        return [e for e in self.elements.values() if e.role == role]
+        return [e for e in self if e.role == role]
     
     @property
     def posts(self) -> list[Element]:
@@ -52,7 +52,8 @@ class ShoulderedTenon(BaseJoint):
         return Part(wedge.wrapped)
 
     @property
-    def shape(self) -> Part:
+    def waste(self) -> Part:
+        """Material removed from the beam to form the tenon and its shoulder."""
         if self.at_start:
             x_deep = self._bbox_min_x
             x_flush = self._bbox_min_x + self.shoulder_depth
@@ -84,9 +85,11 @@ class ShoulderedTenon(BaseJoint):
             tenon_waste_bbox = tenon_waste.bounding_box()
             shoulder_wedge = shoulder_wedge.move(Location((tenon_waste_bbox.max.X - bbox.max.X, -bbox.min.Y, 0)))
         # Final cut = tenon waste - shoulder wedge (don't cut the wedge area)
-        final_cut = tenon_waste - shoulder_wedge
-        
-        return self._input_shape - final_cut
+        return tenon_waste - shoulder_wedge
+
+    @property
+    def shape(self) -> Part:
+        return self._input_shape - self.waste
 
     @property 
     def shoulder_angle(self) -> float:
@@ -3,7 +3,10 @@
 import copy
 import math
 from typing import Tuple
-from build123d import Align, Axis, Box, Part, Location, Polyline, make_face, extrude, loft, Sketch, Rectangle, Plane
+from build123d import Align, Axis, BoundBox, Box, Cylinder, Part, Location, Polyline, make_face, extrude, loft, Sketch, Rectangle, Plane
+from OCP.BRepBuilderAPI import BRepBuilderAPI_GTransform
+from OCP.gp import gp_GTrsf
+from timber_joints.beam import Beam
 
 
 # =============================================================================
@@ -43,9 +46,6 @@ def expand_shape_by_margin(shape: Part, margin: float) -> Part:
     Returns:
         A new shape scaled non-uniformly to achieve the margin expansion
     """
-    from OCP.gp import gp_GTrsf
-    from OCP.BRepBuilderAPI import BRepBuilderAPI_GTransform
-    
     # Deep copy to avoid mutating the original
     shape = copy.deepcopy(shape)
     
@@ -82,18 +82,29 @@ def expand_shape_by_margin(shape: Part, margin: float) -> Part:
 # =============================================================================
 
 
-def get_shape_dimensions(shape) -> Tuple[Part, float, float, float]:
-    """Extract Part shape and XYZ dimensions from a Beam or Part.
+def get_shape_bbox(shape) -> Tuple[Part, BoundBox]:
+    """Extract Part shape and its bounding box from a Beam or Part.
     
-    Accepts either a Beam (with .shape attribute) or raw Part.
-    Uses bounding box for dimensions, so works with already-cut shapes.
+    Use this when both the dimensions and the bbox position are needed,
+    so the BRep is only traversed once.
     """
+    if isinstance(shape, Beam):
+        # An uncut beam's box is known from its dimensions
+        return shape.shape, shape.bounding_box()
     if hasattr(shape, 'shape'):
         part_shape = shape.shape
     else:
         part_shape = shape
+    return part_shape, part_shape.bounding_box()
+
+
+def get_shape_dimensions(shape) -> Tuple[Part, float, float, float]:
+    """Extract Part shape and XYZ dimensions from a Beam or Part.
     
-    bbox = part_shape.bounding_box()
+    Accepts either a Beam (with .shape attribute) or raw Part.
+    Uses bounding box for dimensions, so works with already-cut shapes.
+    """
+    part_shape, bbox = get_shape_bbox(shape)
     length = bbox.max.X - bbox.min.X
     width = bbox.max.Y - bbox.min.Y
     height = bbox.max.Z - bbox.min.Z
@@ -276,8 +287,6 @@ def create_peg(length: float, diameter: float, axis: Axis = Axis.Y) -> Part:
     Returns:
         Cylindrical part positioned at origin along specified axis
     """
-    from build123d import Cylinder
-    
     # Create cylinder along Z axis first
     peg = Cylinder(radius=diameter / 2, height=length, align=(Align.CENTER, Align.CENTER, Align.MIN))
     
@@ -0,0 +1,97 @@
+"""Tests for blind mortise positioning."""
+
+import sys
+sys.path.insert(0, "src")
+
+import pytest
+from build123d import Location
+from timber_joints.beam import Beam
+from timber_joints.shouldered_tenon import ShoulderedTenon
+from timber_joints.alignment import (
+    align_beam_in_post,
+    make_post_vertical,
+    create_receiving_cut,
+    position_for_blind_mortise,
+)
+
+
+def _bounds(shape):
+    bb = shape.bounding_box()
+    return (bb.min.X, bb.min.Y, bb.min.Z, bb.max.X, bb.max.Y, bb.max.Z)
+
+
+def _blind_mortise_setup():
+    """Shouldered tenon at the beam start, post moved to the beam (demo 5.C)."""
+    post = Beam(length=400, width=150, height=150)
+    beam = Beam(length=600, width=80, height=120)
+    beam_with_tenon = ShoulderedTenon(
+        beam=beam,
+        tenon_width=beam.width / 3,
+        tenon_height=beam.height * 2 / 3,
+        tenon_length=60,
+        shoulder_depth=20,
+        at_start=True,
+    ).shape
+    _, positioned_post, _ = align_beam_in_post(
+        beam=beam_with_tenon,
+        post=make_post_vertical(post.shape),
+        drop_depth=beam.height,
+        at_start=True,
+        move_post=True,
+    )
+    return beam_with_tenon, positioned_post
+
+
+def test_position_for_blind_mortise_does_not_mutate_inputs():
+    """The offset shape is a copy; the caller's beam and post stay put."""
+    beam, post = _blind_mortise_setup()
+    beam_before = _bounds(beam)
+    post_before = _bounds(post)
+
+    beam_for_cut, post_for_cut = position_for_blind_mortise(
+        beam=beam,
+        post=post,
+        tenon_length=60,
+        housing_depth=20,
+        post_top_extension=40,
+        at_start=True,
+    )
+
+    assert _bounds(beam) == pytest.approx(beam_before)
+    assert _bounds(post) == pytest.approx(post_before)
+    assert post_for_cut is post
+    # Beam is offset into the post and down by the top extension
+    post_x_extent = post_before[3] - post_before[0]
+    x_offset = post_x_extent - 20 - 60
+    expected = (
+        beam_before[0] + x_offset, beam_before[1], beam_before[2] - 40,
+        beam_before[3] + x_offset, beam_before[4], beam_before[5] - 40,
+    )
+    assert _bounds(beam_for_cut) == pytest.approx(expected, abs=1e-6)
+
+
+def test_blind_mortise_cut_volume():
+    """Cutting with the returned beam gives the blind mortise, not a through cut."""
+    beam, post = _blind_mortise_setup()
+    post_x0, _, _, post_x1, _, _ = _bounds(post)
+    x_offset = (post_x1 - post_x0) - 20 - 60
+
+    beam_for_cut, post_for_cut = position_for_blind_mortise(
+        beam=beam,
+        post=post,
+        tenon_length=60,
+        housing_depth=20,
+        post_top_extension=40,
+        at_start=True,
+    )
+    cut = create_receiving_cut(positioned_insert=beam_for_cut, receiving_shape=post_for_cut)
+
+    expected = create_receiving_cut(
+        positioned_insert=beam.moved(Location((x_offset, 0, -40))),
+        receiving_shape=post,
+    )
+    assert cut.volume == pytest.approx(expected.volume, rel=1e-6)
+    assert cut.volume == pytest.approx(8_751_033, rel=1e-3)
+    # Cutting with the un-offset beam removes a different amount of material
+    wrong = create_receiving_cut(positioned_insert=beam, receiving_shape=post)
+    assert wrong.volume != pytest.approx(cut.volume, rel=1e-3)
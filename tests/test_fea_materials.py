@@ -0,0 +1,31 @@
+"""Tests for orthotropic timber material matrices."""
+
+import sys
+sys.path.insert(0, "src")
+
+import numpy as np
+import pytest
+from timber_joints.fea import SoftwoodC16
+from timber_joints.fea.materials import _voigt_of
+
+
+def test_stiffness_matrix_is_symmetric():
+    C = SoftwoodC16().elastic.stiffness_matrix()
+    assert C.shape == (6, 6)
+    np.testing.assert_allclose(C, C.T, rtol=1e-9, atol=1e-9)
+
+
+def test_stiffness_inverts_compliance():
+    elastic = SoftwoodC16().elastic
+    product = elastic.stiffness_matrix() @ elastic.compliance_matrix()
+    np.testing.assert_allclose(product, np.eye(6), atol=1e-9)
+
+
+def test_cached_voigt_matrix_is_read_only():
+    material = SoftwoodC16()
+    C = material.C_voigt
+    assert C is _voigt_of(material.elastic)
+    assert not C.flags.writeable
+    with pytest.raises(ValueError):
+        C[0, 0] = 0.0
+    np.testing.assert_allclose(C, material.elastic.stiffness_matrix())
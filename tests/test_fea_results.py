@@ -0,0 +1,82 @@
+"""Tests for FEA result reductions."""
+
+import sys
+sys.path.insert(0, "src")
+
+import pytest
+from timber_joints.fea import displacement_extremes, stress_extremes
+
+
+def test_displacement_extremes_keeps_sign_of_larger_negative():
+    """A negative peak with the larger magnitude is reported as negative."""
+    displacements = {
+        1: (0.5, -2.0, 0.25),
+        2: (-1.5, 1.0, 0.0),
+    }
+    max_total, max_ux, max_uy, max_uz = displacement_extremes(displacements)
+    assert max_ux == pytest.approx(-1.5)
+    assert max_uy == pytest.approx(-2.0)
+    assert max_uz == pytest.approx(0.25)
+    assert max_total == pytest.approx((0.5**2 + 2.0**2 + 0.25**2) ** 0.5, rel=1e-6)
+
+
+def test_displacement_extremes_all_negative():
+    displacements = {
+        1: (-1.0, -3.0, -0.5),
+        2: (-4.0, -2.0, -0.25),
+    }
+    _, max_ux, max_uy, max_uz = displacement_extremes(displacements)
+    assert max_ux == pytest.approx(-4.0)
+    assert max_uy == pytest.approx(-3.0)
+    assert max_uz == pytest.approx(-0.5)
+
+
+def test_displacement_extremes_ties_take_first_node():
+    """Equal magnitudes of opposite sign resolve to the first node's value."""
+    _, max_ux, max_uy, _ = displacement_extremes({
+        1: (-2.0, 3.0, 0.0),
+        2: (2.0, -3.0, 0.0),
+    })
+    assert max_ux == pytest.approx(-2.0)
+    assert max_uy == pytest.approx(3.0)
+
+
+def test_displacement_extremes_empty_and_single_node():
+    assert displacement_extremes({}) == (0.0, 0.0, 0.0, 0.0)
+
+    max_total, max_ux, max_uy, max_uz = displacement_extremes({7: (3.0, -4.0, 0.0)})
+    assert max_total == pytest.approx(5.0)
+    assert (max_ux, max_uy, max_uz) == pytest.approx((3.0, -4.0, 0.0))
+
+
+def test_stress_extremes_signed_normals():
+    stresses = {
+        1: (2.0, -8.0, 1.0, 0.0, 0.0, 0.0),
+        2: (5.0, -1.0, 0.5, 0.0, 0.0, 0.0),
+    }
+    max_von_mises, max_normal, min_normal = stress_extremes(stresses)
+    assert max_normal == pytest.approx(5.0)
+    assert min_normal == pytest.approx(-8.0)
+    # Uniaxial-like node 1 dominates: sqrt(0.5 * (10² + 9² + 1²))
+    assert max_von_mises == pytest.approx((0.5 * (100 + 81 + 1)) ** 0.5, rel=1e-6)
+
+
+def test_stress_extremes_all_negative_clamps_max_to_zero():
+    max_von_mises, max_normal, min_normal = stress_extremes({
+        1: (-2.0, -3.0, -1.0, 0.0, 0.0, 0.0),
+        2: (-6.0, -0.5, -0.25, 0.0, 0.0, 0.0),
+    })
+    assert max_normal == 0.0
+    assert min_normal == pytest.approx(-6.0)
+    assert max_von_mises > 0.0
+
+
+def test_stress_extremes_empty_and_single_node():
+    assert stress_extremes({}) == (0.0, 0.0, 0.0)
+
+    max_von_mises, max_normal, min_normal = stress_extremes({
+        3: (4.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+    })
+    assert max_von_mises == pytest.approx(4.0)
+    assert max_normal == pytest.approx(4.0)
+    assert min_normal == 0.0
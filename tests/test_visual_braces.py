@@ -18,12 +18,6 @@ from timber_joints.alignment import (
 from pathlib import Path
 from ocp_vscode import reset_show, show_object
 
-reset_show()
-
-# Create output directory
-output_dir = Path("brace_test_output")
-output_dir.mkdir(exist_ok=True)
-
 
 def test_brace_calculations():
     """Test the brace angle and length calculations."""
@@ -47,7 +41,7 @@ def test_brace_calculations():
     print("✓ Brace calculations correct")
 
 
-def test_single_brace():
+def test_single_brace(tmp_path):
     """Test creating a single brace between a post and beam."""
     # Create a simple post and beam
     post_height = 2500
@@ -84,9 +78,9 @@ def test_single_brace():
     print(f"Brace angle: {brace_result.angle:.1f}°")
     
     # Export for visualization
-    export_step(vertical_post, str(output_dir / "post.step"))
-    export_step(positioned_beam, str(output_dir / "beam.step"))
-    export_step(brace, str(output_dir / "brace.step"))
+    export_step(vertical_post, str(tmp_path / "post.step"))
+    export_step(positioned_beam, str(tmp_path / "beam.step"))
+    export_step(brace, str(tmp_path / "brace.step"))
     
     # Verify brace position
     brace_bbox = brace.bounding_box()
@@ -106,7 +100,7 @@ def test_single_brace():
     print("✓ Single brace created and positioned correctly")
 
 
-def test_bent_with_braces():
+def test_bent_with_braces(tmp_path):
     """Test creating a complete bent with braces on both posts."""
     # Build a bent using the new API with JointParams
     joint_params = JointParams(
@@ -164,19 +158,19 @@ def test_bent_with_braces():
     show_object(brace_right, name="Right Brace", options={"color": "orange"})
     
     # Export all parts
-    export_step(left_post, str(output_dir / "bent_left_post.step"))
-    export_step(right_post, str(output_dir / "bent_right_post.step"))
-    export_step(beam, str(output_dir / "bent_beam.step"))
-    export_step(brace_left, str(output_dir / "bent_brace_left.step"))
-    export_step(brace_right, str(output_dir / "bent_brace_right.step"))
+    export_step(left_post, str(tmp_path / "bent_left_post.step"))
+    export_step(right_post, str(tmp_path / "bent_right_post.step"))
+    export_step(beam, str(tmp_path / "bent_beam.step"))
+    export_step(brace_left, str(tmp_path / "bent_brace_left.step"))
+    export_step(brace_right, str(tmp_path / "bent_brace_right.step"))
     
-    print("✓ Bent with braces exported to", output_dir)
+    print("✓ Bent with braces exported to", tmp_path)
     
     # Skip position verification for now - focus on visual check
     print("✓ Bent brace positions - check OCP viewer")
 
 
-def test_girt_braces():
+def test_girt_braces(tmp_path):
     """Test creating braces for girts (Y-direction horizontal members)."""
     # Create a post and a girt running along Y
     post_height = 2500
@@ -220,9 +214,9 @@ def test_girt_braces():
     print(f"Girt brace angle: {brace_result.angle:.1f}°")
     
     # Export for visualization
-    export_step(vertical_post, str(output_dir / "girt_post.step"))
-    export_step(positioned_girt, str(output_dir / "girt.step"))
-    export_step(brace, str(output_dir / "girt_brace.step"))
+    export_step(vertical_post, str(tmp_path / "girt_post.step"))
+    export_step(positioned_girt, str(tmp_path / "girt.step"))
+    export_step(brace, str(tmp_path / "girt_brace.step"))
     
     # Verify brace position
     brace_bbox = brace.bounding_box()
@@ -242,7 +236,11 @@ def test_girt_braces():
 
 
 if __name__ == "__main__":
+    # Clear the viewer only when run as a script, not on pytest collection
+    reset_show()
+    output_dir = Path("brace_test_output")
+    output_dir.mkdir(exist_ok=True)
     # Only run the bent with braces test for visual verification
-    test_bent_with_braces()
-    test_girt_braces()
+    test_bent_with_braces(output_dir)
+    test_girt_braces(output_dir)
     print("\n✅ Visual brace test complete - check the OCP viewer!")